@@ -16,7 +16,9 @@ def create_app():
     """Application factory for Flask app."""
     app = Flask(
         'OppNDA',
-        static_folder=str(BASE_DIR / 'GUI'),
+        # GUI assets go through routes.serve_gui_static (with a cache max-age);
+        # Flask's own static route would shadow it at the same /GUI URL
+        static_folder=None,
         template_folder=str(BASE_DIR / 'GUI')
     )
     
@@ -49,7 +49,9 @@ import json
 import copy
 import platform
 import subprocess
+import time
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Optional, Tuple, Any
 from flask import Blueprint, jsonify, request, current_app, Response
@@ -257,6 +259,17 @@ def get_config_path(config_name: str) -> Path:
     return config_dir / CONFIG_FILES.get(config_name, '')
 
 
+@lru_cache(maxsize=32)
+def _load_config_file(path: str, mtime_ns: int, size: int) -> dict:
+    """Parse a config file once per (mtime, size) so repeat GETs skip the disk.
+    
+    Writes change the file's stat, so the next read misses the cache. The
+    returned dict is shared between calls and must not be modified.
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
 def _load_gui_options():
     """Load gui_options.json from the config directory.
     
@@ -367,8 +380,8 @@ def get_config(config_name):
         return jsonify({'error': f'Config file not found: {config_path}'}), 404
     
     try:
-        with open(config_path, 'r', encoding='utf-8') as f:
-            config_data = json.load(f)
+        stat = config_path.stat()
+        config_data = _load_config_file(str(config_path), stat.st_mtime_ns, stat.st_size)
         return jsonify(config_data)
     except json.JSONDecodeError as e:
         return jsonify({'error': f'Invalid JSON: {str(e)}'}), 500
@@ -597,7 +610,6 @@ def run_one_simulator():
         
         def generate_simulation_stream():
             """Generator that yields SSE events for the simulation."""
-            import time
             
             # Helper function to create SSE data line
             def sse_event(event_type, message, level=None, success=None):
@@ -642,7 +654,7 @@ def run_one_simulator():
                 
                 # Track progress
                 sim_count = 0
-                start_time = time.time()
+                start_time = time.perf_counter()
                 
                 # Stream each line as it's produced
                 for line in iter(process.stdout.readline, ''):
@@ -674,7 +686,7 @@ def run_one_simulator():
                 # Clean up process tracking
                 _active_processes.pop('simulation', None)
                 
-                elapsed = time.time() - start_time
+                elapsed = time.perf_counter() - start_time
                 if elapsed > 60:
                     elapsed_str = f"{elapsed/60:.1f} minutes"
                 else:
@@ -1192,7 +1204,6 @@ def run_regression_only():
 
 def stream_subprocess(command, cwd):
     """Generator that yields SSE events from subprocess output line by line."""
-    import time
     
     yield f"data: {json.dumps({'type': 'start', 'message': f'Starting: {command}'})}\n\n"
     
@@ -58,7 +58,8 @@ def serve_plot(filename):
 def serve_gui_static(filename):
     """Serve static GUI files."""
     gui_dir = current_app.config['BASE_DIR'] / 'GUI'
-    return send_from_directory(str(gui_dir), filename)
+    # Browsers may cache GUI assets for an hour; they revalidate via ETag after
+    return send_from_directory(str(gui_dir), filename, max_age=3600)
 
 
 @main_bp.route('/run-one', methods=['POST'])
@@ -904,7 +904,7 @@ def main():
     
     if plot_jobs:
         print(f"Processing {len(plot_jobs)} plots...")
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         # Dynamic worker calculation using ResourceManager
         if RESOURCE_MANAGER_AVAILABLE:
@@ -922,7 +922,7 @@ def main():
             # Use imap_unordered for faster processing
             results = list(pool.imap_unordered(execute_plot_job, plot_jobs, chunksize=max(1, len(plot_jobs) // num_processes)))
         
-        elapsed = time.time() - start_time
+        elapsed = time.perf_counter() - start_time
         successful = sum(1 for r in results if r)
         print(f"Completed: {successful}/{len(plot_jobs)} plots in {elapsed:.2f}s", flush=True)
     
@@ -4,7 +4,7 @@ Report Averager Module
 ======================
 
 A flexible, high-performance tool for averaging multiple simulation report files.
-Optimized with multiprocessing for enhanced performance on multi-core systems.
+Optimized with a thread pool for parallel report file reading.
 
 This module processes report files generated by the ONE (Opportunistic Network
 Environment) simulator and groups them based on configurable parameters,
@@ -27,23 +27,32 @@ Attributes:
     PROJECT_ROOT (Path): Root directory of the project.
     CONFIG_DIR (Path): Directory containing configuration files.
     RESOURCE_MANAGER_AVAILABLE (bool): Whether resource manager is available.
+    BOTTLENECK_AVAILABLE (bool): Whether bottleneck is available for faster
+        NaN-aware averaging (falls back to ``np.nanmean``).
+    NUMBA_AVAILABLE (bool): Whether numba is available to JIT the NaN-aware
+        averaging kernel when bottleneck is not installed.
 
 Note:
-    This module uses multiprocessing for parallel file reading. The number of
-    workers is dynamically calculated based on available RAM and CPU cores
+    This module uses a thread pool for parallel file reading; the work is
+    I/O-bound, so threads avoid process startup and result pickling. The number
+    of workers is dynamically calculated based on available RAM and CPU cores
     when the ResourceManager is available.
 """
 
 import os
 import json
+import mmap
 import numpy as np
-from collections import defaultdict
+from collections import defaultdict, namedtuple
+from functools import lru_cache, partial
 import re
 import sys
 from pathlib import Path
-from multiprocessing import Pool, Manager
+from concurrent.futures import ThreadPoolExecutor
 import traceback
 import time
+import warnings
+from types import MappingProxyType
 
 # Cross-platform path resolution
 SCRIPT_DIR = Path(__file__).resolve().parent
@@ -57,70 +66,264 @@ try:
 except ImportError:
     RESOURCE_MANAGER_AVAILABLE = False
 
+# Use bottleneck's fused NaN-aware reductions when installed
+try:
+    import bottleneck as bn
+    BOTTLENECK_AVAILABLE = True
+except ImportError:
+    BOTTLENECK_AVAILABLE = False
+
+# Numba JIT kernel is the next best option when bottleneck is missing
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+@lru_cache(maxsize=None)
+def _line_regex(separator):
+    """Compile the ``field<sep>value`` line pattern for a data separator.
+    
+    Matches one line per record with surrounding blanks stripped, the field
+    ending at the first separator and the value a single token. Values with
+    embedded blanks never parsed as floats, so they are skipped as before.
+    """
+    sep = re.escape(separator.encode())
+    if len(separator) == 1:
+        field = rb'([^' + sep + rb'\r\n]*?)'
+    else:
+        field = rb'((?:(?!' + sep + rb')[^\r\n])*?)'
+    return re.compile(rb'^[ \t]*' + field + rb'[ \t]*' + sep + rb'[ \t]*(\S+)[ \t\r]*$', re.M)
+
+
+# Parsed report file as parallel field/value arrays; values is None on error
+ParsedReport = namedtuple('ParsedReport', ['filepath', 'fields', 'values'])
+
+
 def read_and_parse_file_parallel(args):
-    """Worker function for parallel file reading and parsing"""
+    """Worker function for parallel file reading and parsing.
+    
+    The file is memory-mapped and all ``(field, value)`` pairs are extracted
+    with a single compiled regex pass over the mapping.
+    
+    Returns:
+        ParsedReport: Field names as a tuple and their values as a float64
+            array, so the caller can scatter them straight into the matrix.
+    """
     filepath, separator, ignore_fields = args
+    line_re = _line_regex(separator)
     
     try:
-        data = {}
-        with open(filepath, 'r') as f:
-            for line in f:
-                line = line.strip()
-                if not line or separator not in line:
-                    continue
-                
-                field, value = line.split(separator, 1)
-                field = field.strip()
-                value = value.strip()
-                
-                if field in ignore_fields:
-                    continue
-                
+        with open(filepath, 'rb') as f:
+            # mmap cannot map an empty file
+            if os.fstat(f.fileno()).st_size == 0:
+                return ParsedReport(filepath, (), np.empty(0))
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                pairs = line_re.findall(mm)
+        
+        fields = []
+        tokens = []
+        for field, value in pairs:
+            field = field.decode()
+            if field not in ignore_fields:
+                fields.append(field)
+                tokens.append(value)
+        
+        try:
+            # One vectorized C-level conversion ('nan'/'NaN' parse to NaN)
+            converted = np.array(tokens, dtype=bytes).astype(np.float64)
+        except ValueError:
+            # Some token is not numeric: convert one by one and skip those
+            numeric_fields = []
+            converted = []
+            for field, value in zip(fields, tokens):
                 try:
-                    data[field] = float(value) if value.lower() != 'nan' else np.nan
+                    converted.append(float(value))
                 except ValueError:
                     continue
-        
-        return filepath, data
+                numeric_fields.append(field)
+            fields = numeric_fields
+        
+        # Duplicate fields keep their last numeric value
+        data = dict(zip(fields, converted))
+        if len(data) == len(fields):
+            return ParsedReport(filepath, tuple(fields), np.asarray(converted, dtype=np.float64))
+        values = np.fromiter(data.values(), dtype=np.float64, count=len(data))
+        return ParsedReport(filepath, tuple(data), values)
     except Exception as e:
         print(f"Error reading {filepath}: {e}")
-        return filepath, None
+        return ParsedReport(filepath, (), None)
+
+
+# Groups at least this large queue readahead for a whole chunk up front
+PREFETCH_MIN_FILES = 256
 
-def average_group_data(aggregated):
+
+def prefetch_files(filepaths):
+    """Ask the kernel to start reading every file before any is parsed.
+    
+    Queuing the reads for a whole batch lets the OS merge and reorder disk
+    I/O instead of serving one blocking read at a time. No-op where
+    ``posix_fadvise`` is unavailable (e.g. Windows).
+    """
+    if not hasattr(os, 'posix_fadvise'):
+        return
+    for filepath in filepaths:
+        try:
+            fd = os.open(filepath, os.O_RDONLY)
+        except OSError:
+            continue
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
+
+def read_and_parse_batch(batch, prefetch=False):
+    """Parse a chunk of files in one pool task to amortize scheduling cost"""
+    if prefetch:
+        prefetch_files([args[0] for args in batch])
+    return [read_and_parse_file_parallel(args) for args in batch]
+
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, cache=True)
+    def _nanmean_rows(matrix_t):
+        """Fused single-pass NaN-aware mean of each row (one row per field).
+        
+        fastmath is deliberately off: it lets LLVM assume no NaNs and would
+        drop the ``isnan`` test.
+        """
+        n_fields, n_files = matrix_t.shape
+        out = np.empty(n_fields)
+        for j in prange(n_fields):
+            total = 0.0
+            count = 0
+            for i in range(n_files):
+                x = matrix_t[j, i]
+                if not np.isnan(x):
+                    total += x
+                    count += 1
+            out[j] = total / count if count else np.nan
+        return out
+
+
+def _nanmean_columns(matrix):
+    """NaN-aware column means using the fastest available backend"""
+    if BOTTLENECK_AVAILABLE:
+        return bn.nanmean(matrix, axis=0)
+    if NUMBA_AVAILABLE:
+        # Transpose once so each field's values are contiguous
+        return _nanmean_rows(np.ascontiguousarray(matrix.T))
+    return np.nanmean(matrix, axis=0)
+
+
+def average_group_data(matrix, fields):
     """Calculate averages from aggregated data.
     
-    Takes a dictionary of field names to lists of values and calculates
-    the mean for each field, properly handling NaN values.
+    Takes a ``(n_files, n_fields)`` matrix with one row per report file and
+    one column per field, and calculates the mean of each column in a single
+    vectorized pass, ignoring NaN values (missing fields are stored as NaN).
+    Columns without NaNs skip the masked ``nanmean`` reduction entirely.
     
     Args:
-        aggregated (dict): Dictionary mapping field names to lists of values.
-            Example: {'delivery_prob': [0.9, 0.92, 0.88], 'latency': [100, 110, 105]}
+        matrix (np.ndarray): 2D float64 array of shape ``(n_files, n_fields)``.
+        fields (list): Field names, one per matrix column.
+            Example: ['delivery_prob', 'latency']
     
     Returns:
         dict: Dictionary mapping field names to their averaged values.
-            Fields with no valid values are excluded from the result.
+            Fields whose values are all NaN average to NaN.
     
     Example:
-        >>> data = {'metric1': [1.0, 2.0, 3.0], 'metric2': [np.nan, np.nan]}
-        >>> avg = average_group_data(data)
+        >>> m = np.array([[1.0, np.nan], [2.0, np.nan], [3.0, np.nan]])
+        >>> avg = average_group_data(m, ['metric1', 'metric2'])
         >>> print(avg)  # {'metric1': 2.0, 'metric2': nan}
     """
-    averaged = {}
-    for field, values in aggregated.items():
-        # Filter out NaN values and check if there's data to average
-        valid_values = [v for v in values if v is not None and not np.isnan(v)]
-        if valid_values:
-            averaged[field] = np.mean(valid_values)
-        elif values:  # Has values but all are NaN
-            averaged[field] = np.nan
-        # If no values at all, skip the field
-    return averaged
+    if matrix.size == 0:
+        return {}
+    
+    # Fast path: plain mean is a single pass; only NaN-bearing columns
+    # need the slower masked reduction
+    has_nan = np.isnan(matrix).any(axis=0)
+    means = matrix.mean(axis=0)
+    if has_nan.any():
+        with warnings.catch_warnings():
+            # All-NaN columns legitimately average to NaN
+            warnings.simplefilter('ignore', category=RuntimeWarning)
+            means[has_nan] = _nanmean_columns(matrix[:, has_nan])
+    return dict(zip(fields, means.tolist()))
+
+@lru_cache(maxsize=None)
+def _parse_filename(filename, delimiter, components_key, extract_key):
+    """Split a filename into its pattern components (memoized).
+    
+    Filenames are re-parsed once per grouping strategy, so results are
+    cached on the filename and the frozen pattern.
+    
+    Args:
+        filename (str): Report filename including extension.
+        delimiter (str): Delimiter between filename components.
+        components_key (tuple): ``(name, position)`` pairs from the pattern.
+        extract_key (tuple): ``(name, compiled regex)`` pairs from the pattern.
+    
+    Returns:
+        tuple: ``(components, error)``. ``components`` is a read-only
+            mapping of component name to value, shared by every caller,
+            or None on failure, in which case ``error`` is
+            ``(name, position, num_parts)``.
+    """
+    # Remove extension and split by delimiter
+    parts = filename.rsplit('.', 1)[0].split(delimiter)
+    extract = dict(extract_key)
+    
+    components = {}
+    for comp_name, position in components_key:
+        try:
+            value = parts[position]
+            
+            # Apply extraction if specified
+            if comp_name in extract:
+                match = extract[comp_name].search(value)
+                if match:
+                    value = match.group(1)
+            
+            components[comp_name] = value
+        except IndexError:
+            return None, (comp_name, position, len(parts))
+    
+    return MappingProxyType(components), None
+
+
+# A {placeholder}, or a literal run of text (a lone '{' is literal)
+_TEMPLATE_TOKEN_RE = re.compile(r'\{([^{}]*)\}|[^{]+|\{')
+
+
+@lru_cache(maxsize=None)
+def _tokenize_template(template):
+    """Split an output template into ``(field, text)`` tokens once.
+    
+    ``field`` is the placeholder name, or None for literal text; ``text`` is
+    the token exactly as written in the template.
+    """
+    return tuple((m.group(1), m.group(0)) for m in _TEMPLATE_TOKEN_RE.finditer(template))
+
+
+def render_template(template, subs):
+    """Fill ``{field}`` placeholders from ``subs``; unknown ones are kept as-is"""
+    return ''.join(
+        str(subs[field]) if field is not None and field in subs else text
+        for field, text in _tokenize_template(template)
+    )
+
 
 class ReportAverager:
     """Report file averaging and aggregation engine.
     
     This class groups simulation report files based on configurable parameters
-    and calculates averages across multiple runs. It uses multiprocessing for
+    and calculates averages across multiple runs. It uses a thread pool for
     parallel file reading to maximize performance.
     
     The averaging process:
@@ -128,14 +331,14 @@ class ReportAverager:
     1. Scans the reports directory for matching files
     2. Parses filenames to extract component values (router, TTL, buffer, etc.)
     3. Groups files based on configured grouping parameters
-    4. Reads files in parallel using multiprocessing
+    4. Reads files in parallel using a shared thread pool
     5. Calculates averages for each metric within each group
     6. Writes averaged results to output files
     
     Attributes:
         config (dict): Loaded configuration from JSON file.
         safety_enabled (bool): Whether memory-safe resource management is enabled.
-        num_processes (int): Number of worker processes for parallel operations.
+        num_processes (int): Number of worker threads for parallel file reading.
         resource_manager (ResourceManager): Dynamic resource manager (if available).
     
     Example:
@@ -161,13 +364,25 @@ class ReportAverager:
         self.validate_config()
         self.safety_enabled = safety_enabled
         
+        # Hashable view of the filename pattern for the parse cache
+        pattern = self.config['filename_pattern']
+        self._extract_res = self.compile_extract_patterns(pattern.get('extract', {}))
+        self._components_key = tuple(pattern['components'].items())
+        self._extract_key = tuple(self._extract_res.items())
+        
         # Dynamic worker calculation using ResourceManager
         if RESOURCE_MANAGER_AVAILABLE:
             self.resource_manager = ResourceManager(safety_enabled=safety_enabled)
             self.num_processes = self.resource_manager.get_optimal_workers()
         else:
-            # Fallback to static limit
-            self.num_processes = min(4, os.cpu_count() or 1)
+            # Fallback: one reader thread per core
+            self.num_processes = max(1, os.cpu_count() or 1)
+        
+        # One-shot debug/warning flags
+        self._debug_shown = False
+        self._parse_error_shown = False
+        self._shown_parse_error = False
+        self._shown_parse_success = False
         
     def load_config(self, config_path):
         """Load and parse configuration file"""
@@ -194,45 +409,47 @@ class ReportAverager:
             print("ERROR: 'average_groups' must be a non-empty list")
             sys.exit(1)
     
-    def parse_filename(self, filename):
-        """Extract components from filename based on pattern"""
+    def compile_extract_patterns(self, extract):
+        """Compile per-component extraction regexes once at config load"""
+        compiled = {}
+        for comp_name, extract_pattern in extract.items():
+            try:
+                compiled[comp_name] = re.compile(extract_pattern)
+            except re.error as e:
+                print(f"ERROR: Invalid extract pattern for '{comp_name}': {e}")
+                sys.exit(1)
+        return compiled
+    
+    def show_parse_debug(self, filename):
+        """Print how the first file of a report type is split into parts"""
         pattern = self.config['filename_pattern']
-        
-        # Remove extension
         name = filename.rsplit('.', 1)[0]
-        
-        # Split by delimiter
-        delimiter = pattern['delimiter']
-        parts = name.split(delimiter)
-        
-        # Debug output for first file
-        if not hasattr(self, '_debug_shown'):
-            print(f"\n  Debug - First file parsing:")
-            print(f"    Original: {filename}")
-            print(f"    After removing extension: {name}")
-            print(f"    Split into {len(parts)} parts: {parts}")
-            print(f"    Expected components: {list(pattern['components'].keys())}")
-            self._debug_shown = True
-        
-        # Extract components
-        components = {}
-        for comp_name, position in pattern['components'].items():
-            try:
-                value = parts[position]
-                
-                # Apply extraction if specified
-                if 'extract' in pattern and comp_name in pattern['extract']:
-                    extract_pattern = pattern['extract'][comp_name]
-                    match = re.search(extract_pattern, value)
-                    if match:
-                        value = match.group(1)
-                
-                components[comp_name] = value
-            except IndexError:
-                if not hasattr(self, '_parse_error_shown'):
-                    print(f"    ERROR: Position {position} for '{comp_name}' not found (only have {len(parts)} parts)")
-                    self._parse_error_shown = True
-                return None
+        parts = name.split(pattern['delimiter'])
+        print(f"\n  Debug - First file parsing:")
+        print(f"    Original: {filename}")
+        print(f"    After removing extension: {name}")
+        print(f"    Split into {len(parts)} parts: {parts}")
+        print(f"    Expected components: {list(pattern['components'].keys())}")
+        self._debug_shown = True
+    
+    def parse_filename(self, filename):
+        """Extract components from filename based on pattern"""
+        components = self._cached_components(filename)
+        return None if components is None else dict(components)
+    
+    def _cached_components(self, filename):
+        """Return the shared read-only components mapping, or None on failure"""
+        components, error = _parse_filename(
+            filename, self.config['filename_pattern']['delimiter'],
+            self._components_key, self._extract_key
+        )
+        
+        if components is None:
+            comp_name, position, num_parts = error
+            if not self._parse_error_shown:
+                print(f"    ERROR: Position {position} for '{comp_name}' not found (only have {num_parts} parts)")
+                self._parse_error_shown = True
+            return None
         
         return components
     
@@ -266,26 +483,47 @@ class ReportAverager:
             print(f"Warning: Error reading {filepath}: {e}")
             return None
     
+    def build_file_filter(self, extension, report_type, exclude_prefixes):
+        """Compile all filename filters for one report type into a single regex.
+        
+        A filename matches when it ends with ``extension``, contains
+        ``report_type`` (if given), does not contain "average" in any case
+        (previously generated output) and does not start with any of
+        ``exclude_prefixes`` (output template prefixes).
+        """
+        pattern = r'(?!(?i:.*average))'
+        if exclude_prefixes:
+            pattern += '(?!' + '|'.join(map(re.escape, exclude_prefixes)) + ')'
+        if report_type:
+            pattern += '(?=.*' + re.escape(report_type) + ')'
+        pattern += '.*' + re.escape(extension) + r'\Z'
+        return re.compile(pattern, re.DOTALL)
+    
     def group_files(self, files, group_by):
         """Group files according to specified grouping fields"""
         groups = defaultdict(list)
         skipped = 0
         
+        # Debug output for first file, kept out of the per-file loop
+        if files and not self._debug_shown:
+            self.show_parse_debug(os.path.basename(files[0]))
+        
         for filepath in files:
             filename = os.path.basename(filepath)
-            components = self.parse_filename(filename)
+            # Grouping only reads the cached mapping; no per-strategy copy
+            components = self._cached_components(filename)
             
             if components is None:
-                if not hasattr(self, '_shown_parse_error'):
+                if not self._shown_parse_error:
                     print(f"  Warning: Failed to parse {filename}")
                     self._shown_parse_error = True
                 skipped += 1
                 continue
             
             # Debug: Show parsing result for first file
-            if not hasattr(self, '_shown_parse_success'):
+            if not self._shown_parse_success:
                 print(f"  Debug: Successfully parsed {filename}")
-                print(f"  Components: {json.dumps(components)}")
+                print(f"  Components: {json.dumps(dict(components))}")
                 self._shown_parse_success = True
             
             # Create grouping key
@@ -297,8 +535,14 @@ class ReportAverager:
         
         return groups
     
-    def average_group(self, file_list):
-        """Average data from multiple files using multiprocessing"""
+    def average_group(self, file_list, executor=None):
+        """Average data from multiple files using a thread pool.
+        
+        Args:
+            file_list (list): ``(filepath, components)`` tuples for one group.
+            executor (ThreadPoolExecutor, optional): Pool shared across groups.
+                A temporary pool is created when omitted.
+        """
         separator = self.config.get('data_separator', ':')
         ignore_fields = set(self.config.get('ignore_fields', []))
         
@@ -308,41 +552,49 @@ class ReportAverager:
         # Prepare arguments for parallel processing
         args_list = [(fp, separator, ignore_fields) for fp in filepaths]
         
-        aggregated = defaultdict(list)
-        
-        # Use multiprocessing to read files in parallel
+        # Read files in parallel on the pool shared across groups, a few
+        # chunks per worker so each task covers several files
         if len(filepaths) > 1 and self.num_processes > 1:
+            chunksize = max(1, len(args_list) // (self.num_processes * 4))
+            batches = [args_list[i:i + chunksize] for i in range(0, len(args_list), chunksize)]
+            read_batch = partial(read_and_parse_batch, prefetch=len(args_list) >= PREFETCH_MIN_FILES)
             try:
-                with Pool(processes=self.num_processes) as pool:
-                    results = pool.map(read_and_parse_file_parallel, args_list)
-                
-                for filepath, data in results:
-                    if data is None:
-                        continue
-                    
-                    for field, value in data.items():
-                        aggregated[field].append(value)
+                if executor is not None:
+                    results = [r for batch in executor.map(read_batch, batches) for r in batch]
+                else:
+                    with ThreadPoolExecutor(max_workers=self.num_processes) as executor:
+                        results = [r for batch in executor.map(read_batch, batches) for r in batch]
             except Exception as e:
                 print(f"Error in parallel reading: {e}")
                 traceback.print_exc()
                 # Fallback to single-threaded
-                for filepath, _ in file_list:
-                    data = self.read_report_file(filepath)
-                    if data is None:
-                        continue
-                    for field, value in data.items():
-                        aggregated[field].append(value)
+                results = [read_and_parse_file_parallel(args) for args in args_list]
         else:
             # Single file or sequential processing
-            for filepath, _ in file_list:
-                data = self.read_report_file(filepath)
-                if data is None:
-                    continue
-                for field, value in data.items():
-                    aggregated[field].append(value)
+            results = [read_and_parse_file_parallel(args) for args in args_list]
+        
+        # Build a (n_files, n_fields) matrix; fields absent from a file stay NaN.
+        # Files of one report type share a layout, so the column indices are
+        # resolved once per distinct field sequence and reused for the rest.
+        field_index = {}
+        schema_columns = {}
+        rows = []
+        for report in results:
+            if report.values is None:
+                continue
+            idx = schema_columns.get(report.fields)
+            if idx is None:
+                idx = np.fromiter((field_index.setdefault(field, len(field_index)) for field in report.fields),
+                                  dtype=np.intp, count=len(report.fields))
+                schema_columns[report.fields] = idx
+            rows.append((idx, report.values))
+        
+        matrix = np.full((len(rows), len(field_index)), np.nan)
+        for i, (idx, values) in enumerate(rows):
+            matrix[i, idx] = values
         
         # Calculate averages
-        averaged = average_group_data(dict(aggregated))
+        averaged = average_group_data(matrix, list(field_index))
         return averaged
     
     def generate_output_filename(self, group_key, components):
@@ -356,26 +608,28 @@ class ReportAverager:
         # Add all other components from the first file in group
         subs.update(components)
         
-        # Replace placeholders
-        output_name = template
-        for field, value in subs.items():
-            output_name = output_name.replace(f'{{{field}}}', str(value))
-        
-        return output_name
+        return render_template(template, subs)
     
     def save_averaged_data(self, data, output_path):
         """Save averaged data to file"""
         separator = self.config.get('data_separator', ':')
         precision = self.config.get('output', {}).get('precision', 4)
         
+        # Format every line up front and hand the buffered writer one string
+        payload = ''.join(
+            f"{field}{separator} {value:.{precision}f}\n" for field, value in sorted(data.items())
+        )
         with open(output_path, 'w') as f:
-            for field in sorted(data.keys()):
-                value = data[field]
-                f.write(f"{field}{separator} {value:.{precision}f}\n")
+            f.write(payload)
     
     def run(self):
-        """Main execution method with multiprocessing optimization"""
-        start_time = time.time()
+        """Main execution method; reuses one thread pool across all groups"""
+        with ThreadPoolExecutor(max_workers=self.num_processes) as executor:
+            self._process_reports(executor)
+    
+    def _process_reports(self, executor):
+        """Scan, group, average and write reports for every report type"""
+        start_time = time.perf_counter()
         
         print("="*70)
         print("OppNDA - Averager")
@@ -430,38 +684,13 @@ class ReportAverager:
             print(f"{'#'*70}")
             
             # Reset debug flag for each report type
-            if hasattr(self, '_debug_shown'):
-                delattr(self, '_debug_shown')
-            if hasattr(self, '_parse_error_shown'):
-                delattr(self, '_parse_error_shown')
-            
-            # Find matching files for this report type
-            all_files = []
+            self._debug_shown = False
+            self._parse_error_shown = False
             
-            for file in os.listdir(folder):
-                # Skip if doesn't match extension
-                if not file.endswith(extension):
-                    continue
-                
-                # Skip if doesn't contain report type (if specified)
-                if report_type and report_type not in file:
-                    continue
-                
-                # Skip previously generated average files
-                if "average" in file.lower():
-                    continue
-                
-                # Skip files matching any output template prefix
-                skip = False
-                for prefix in exclude_patterns:
-                    if file.startswith(prefix):
-                        skip = True
-                        break
-                
-                if skip:
-                    continue
-                    
-                all_files.append(os.path.join(folder, file))
+            # Find matching files for this report type in one regex pass
+            file_re = self.build_file_filter(extension, report_type, exclude_patterns)
+            with os.scandir(folder) as entries:
+                all_files = [entry.path for entry in entries if file_re.match(entry.name)]
             
             if not all_files:
                 print(f"No files found for report type '{report_type}' in {folder}")
@@ -505,7 +734,7 @@ class ReportAverager:
                     print(f"  Files: {num_files}")
                     
                     # Average the data
-                    averaged_data = self.average_group(file_list)
+                    averaged_data = self.average_group(file_list, executor)
                     
                     if not averaged_data:
                         print(f"  Warning: No data to average")
@@ -519,10 +748,8 @@ class ReportAverager:
                     subs = dict(zip(group_by, group_key))
                     subs.update(first_components)
                     
-                    # Replace placeholders
-                    output_name = output_template
-                    for field, value in subs.items():
-                        output_name = output_name.replace(f'{{{field}}}', str(value))
+                    # Replace placeholders in one pass over the tokenized template
+                    output_name = render_template(output_template, subs)
                     
                     output_path = os.path.join(folder, output_name)
                     
@@ -540,7 +767,7 @@ class ReportAverager:
             print(f"\n--- {report_type}: {processed} groups processed, {skipped} skipped ---")
         
         # Calculate elapsed time
-        elapsed_time = time.time() - start_time
+        elapsed_time = time.perf_counter() - start_time
         
         # Summary
         print("\n" + "="*70)
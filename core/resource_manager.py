@@ -13,6 +13,8 @@ import threading
 from pathlib import Path
 from typing import Optional, List, Tuple
 
+import numpy as np
+
 # Try to import psutil, use fallback if not available
 try:
     import psutil
@@ -22,6 +24,20 @@ except ImportError:
     print("Warning: psutil not installed. Memory management will use fallback mode.")
 
 
+def _usable_cpu_count() -> int:
+    """CPUs this process may run on (honours affinity/cpusets on Linux)."""
+    if hasattr(os, 'sched_getaffinity'):
+        try:
+            return len(os.sched_getaffinity(0)) or 1
+        except OSError:
+            pass
+    return os.cpu_count() or 1
+
+
+# Measured once at import; every ResourceManager reuses it
+CPU_COUNT = _usable_cpu_count()
+
+
 class ResourceConfig:
     """Configuration for resource management parameters."""
     
@@ -33,8 +49,7 @@ class ResourceConfig:
     MAX_WORKERS = 64        # Maximum worker count (hard cap, allows full CPU usage)
     
     # Use all available CPU cores when psutil unavailable
-    import os as _os
-    FALLBACK_WORKERS = max(4, (_os.cpu_count() or 4))  # Auto-detect CPU count
+    FALLBACK_WORKERS = max(4, CPU_COUNT)  # Auto-detect CPU count
     
     # Safety can be disabled if needed
     SAFETY_ENABLED = True
@@ -50,14 +65,17 @@ class MemoryEstimator:
     def __init__(self, gamma: float = ResourceConfig.GAMMA, 
                  overhead_mb: float = ResourceConfig.M_OVERHEAD_MB):
         self.gamma = gamma
-        self.overhead_bytes = overhead_mb * 1024 * 1024
+        self.overhead_bytes = int(overhead_mb * 1024 * 1024)
+        # gamma as an exact fraction, so estimates stay in integer arithmetic
+        # (no float rounding for files near 2**53 bytes)
+        self._gamma_num, self._gamma_den = float(gamma).as_integer_ratio()
     
     def estimate_file_memory(self, file_size_bytes: int) -> int:
         """
         Estimate memory needed to process a single file.
         Returns memory in bytes.
         """
-        return int(self.gamma * file_size_bytes + self.overhead_bytes)
+        return int(file_size_bytes) * self._gamma_num // self._gamma_den + self.overhead_bytes
     
     def estimate_batch_memory(self, file_sizes: List[int], num_workers: int) -> int:
         """
@@ -70,17 +88,16 @@ class MemoryEstimator:
         Returns:
             Estimated peak memory in bytes
         """
-        if not file_sizes:
+        sizes = np.asarray(file_sizes, dtype=np.int64)
+        k = min(num_workers, sizes.size)
+        if k <= 0:
             return 0
         
-        # Sort files by size (largest first) for worst-case estimation
-        sorted_sizes = sorted(file_sizes, reverse=True)
-        
-        # Peak memory = sum of largest N files being processed concurrently
-        concurrent_files = sorted_sizes[:num_workers]
-        peak_memory = sum(self.estimate_file_memory(size) for size in concurrent_files)
-        
-        return peak_memory
+        # Peak memory = the largest N files being processed concurrently
+        # (worst case); partition selects them in O(n) without a full sort.
+        # Only N <= MAX_WORKERS values remain, summed as exact Python ints.
+        concurrent_files = np.partition(sizes, -k)[-k:]
+        return sum(self.estimate_file_memory(size) for size in concurrent_files.tolist())
     
     def get_file_sizes(self, file_paths: List[str]) -> List[int]:
         """Get sizes of multiple files."""
@@ -103,43 +120,64 @@ class DynamicSemaphore:
     when memory pressure is detected.
     """
     
+    # Seconds between memory re-checks while blocked (safety enabled only)
+    PRESSURE_POLL_INTERVAL = 0.1
+    
     def __init__(self, initial_permits: int, 
                  eta: float = ResourceConfig.ETA,
                  safety_enabled: bool = True):
         self._lock = threading.Lock()
+        self._released = threading.Condition(self._lock)
         self._current_permits = initial_permits
         self._max_permits = initial_permits
         self._eta = eta
         self._safety_enabled = safety_enabled
         self._active_workers = 0
+        self._waiting = 0           # Threads blocked in acquire()
     
     def acquire(self, blocking: bool = True) -> bool:
         """Acquire a permit, potentially waiting if none available."""
         with self._lock:
-            if self._safety_enabled:
-                self._adjust_permits()
-            
-            if self._active_workers < self._current_permits:
-                self._active_workers += 1
-                return True
-            elif not blocking:
-                return False
-        
-        # Blocking wait (simple spin with sleep)
-        import time
-        while True:
-            time.sleep(0.01)
-            with self._lock:
+            while True:
                 if self._safety_enabled:
                     self._adjust_permits()
+                
                 if self._active_workers < self._current_permits:
                     self._active_workers += 1
                     return True
+                elif not blocking:
+                    return False
+                
+                # Each release() wakes one waiter. Permits can also grow when
+                # memory frees up, so with safety on re-check periodically.
+                self._waiting += 1
+                try:
+                    self._released.wait(self.PRESSURE_POLL_INTERVAL if self._safety_enabled else None)
+                finally:
+                    self._waiting -= 1
     
     def release(self):
-        """Release a permit."""
+        """Release a permit and wake one blocked acquirer."""
         with self._lock:
             self._active_workers = max(0, self._active_workers - 1)
+            self._released.notify()
+    
+    def rebalance(self, new_permits: int):
+        """
+        Change the permit ceiling while the semaphore is in use.
+        
+        Raising it admits up to (new - old) blocked acquirers immediately;
+        lowering it takes effect as running workers release.
+        """
+        new_permits = max(1, int(new_permits))
+        with self._lock:
+            added = new_permits - self._current_permits
+            self._max_permits = new_permits
+            self._current_permits = new_permits
+            if self._safety_enabled:
+                self._adjust_permits()
+            if added > 0:
+                self._released.notify(added)
     
     def _adjust_permits(self):
         """Dynamically adjust permits based on memory pressure."""
@@ -210,7 +248,7 @@ class ResourceManager:
         self._estimator = MemoryEstimator(gamma, overhead_mb)
         
         # Cache system info
-        self._cpu_count = os.cpu_count() or 1
+        self._cpu_count = CPU_COUNT
         self._total_ram = self._get_total_ram()
     
     def _get_total_ram(self) -> int:
@@ -235,7 +273,8 @@ class ResourceManager:
         # Fallback: assume 100MB baseline
         return 100 * 1024 * 1024
     
-    def get_optimal_workers(self, file_paths: Optional[List[str]] = None) -> int:
+    def get_optimal_workers(self, file_paths: Optional[List[str]] = None,
+                            file_sizes: Optional[List[int]] = None) -> int:
         """
         Calculate optimal worker count based on available resources.
         
@@ -244,26 +283,45 @@ class ResourceManager:
         Args:
             file_paths: Optional list of file paths to process.
                        If provided, uses actual file sizes for estimation.
+            file_sizes: Optional sizes in bytes, for callers that already
+                       know them (e.g. from a directory scan). Used instead
+                       of file_paths, so no file is stat'ed.
                        
         Returns:
             Optimal number of worker processes
         """
+        return self._optimal_workers(None, file_paths, file_sizes)
+    
+    def _optimal_workers(self, available_ram: Optional[int],
+                         file_paths: Optional[List[str]] = None,
+                         file_sizes: Optional[List[int]] = None) -> int:
+        """get_optimal_workers() against a RAM reading the caller already
+        took, so one status report samples memory once; None samples now."""
         # If safety is disabled, return fallback value
         if not self.safety_enabled:
             return min(ResourceConfig.FALLBACK_WORKERS, self._cpu_count)
         
         # Get memory constraints
-        available_ram = self._get_available_ram()
+        if available_ram is None:
+            available_ram = self._get_available_ram()
         memory_budget = int(self.eta * available_ram)
         
-        # If no file paths provided, use simple estimation
-        if not file_paths:
+        if file_sizes is None and file_paths:
+            file_sizes = self._estimator.get_file_sizes(file_paths)
+        
+        # If no files provided, use simple estimation
+        if file_sizes is None or len(file_sizes) == 0:
             # Assume 10MB average file size
             avg_file_memory = self._estimator.estimate_file_memory(10 * 1024 * 1024)
             max_workers_by_memory = max(1, memory_budget // avg_file_memory)
         else:
-            # Use actual file sizes
-            file_sizes = self._estimator.get_file_sizes(file_paths)
+            # Use actual file sizes (as one array, reused for every P below)
+            file_sizes = np.asarray(file_sizes, dtype=np.int64)
+            
+            # Only the MAX_WORKERS largest files can enter any estimate below,
+            # so select them once instead of scanning every file for each P
+            top = min(ResourceConfig.MAX_WORKERS, file_sizes.size)
+            file_sizes = np.partition(file_sizes, -top)[-top:]
             
             # Binary search for optimal P
             max_workers_by_memory = 1
@@ -325,7 +383,7 @@ class ResourceManager:
             'used_percent': mem.percent,
             'eta_threshold': self.eta,
             'memory_budget_gb': (self.eta * mem.available) / (1024**3),
-            'optimal_workers': self.get_optimal_workers(),
+            'optimal_workers': self._optimal_workers(mem.available),
             'cpu_count': self._cpu_count
         }
     
@@ -352,19 +410,21 @@ class ResourceManager:
 
 # Convenience function for simple usage
 def get_optimal_workers(safety_enabled: bool = True, 
-                        file_paths: Optional[List[str]] = None) -> int:
+                        file_paths: Optional[List[str]] = None,
+                        file_sizes: Optional[List[int]] = None) -> int:
     """
     Quick function to get optimal worker count.
     
     Args:
         safety_enabled: If False, returns static fallback count
         file_paths: Optional file paths for size-based estimation
+        file_sizes: Optional file sizes in bytes (skips stat calls)
         
     Returns:
         Optimal worker count
     """
     rm = ResourceManager(safety_enabled=safety_enabled)
-    return rm.get_optimal_workers(file_paths)
+    return rm.get_optimal_workers(file_paths=file_paths, file_sizes=file_sizes)
 
 
 if __name__ == "__main__":
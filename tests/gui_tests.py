@@ -7,12 +7,185 @@ Comprehensive tests for all frontend components in settings.html and config.js.
 import os
 import sys
 import re
-
-# Add parent directory to path for imports
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import mmap
+import atexit
+from collections import defaultdict, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, wraps
+from html.parser import HTMLParser
+
+# Optional: single-pass Aho-Corasick matching (falls back to one regex scan)
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Optional: C-speed HTML parsing (falls back to html.parser)
+try:
+    import lxml.html
+except ImportError:
+    lxml = None
 
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
+# Add parent directory to path for imports
+if BASE_DIR not in sys.path:
+    sys.path.insert(0, BASE_DIR)
+
+
+@lru_cache(maxsize=None)
+def _map_gui_file(path):
+    """Memory-map a GUI source file read-only; closed at interpreter exit.
+    
+    This is the one cached view of each GUI file that every test reads from.
+    """
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return b''  # mmap refuses empty files
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    atexit.register(mapped.close)
+    return mapped
+
+
+_WORD_CHAR = re.compile(r'\w')
+
+
+def _bounded(needle):
+    """Escape a needle, anchoring each edge that is a word character so it
+    cannot match inside a longer identifier (e.g. 'Router' in 'RouterX')"""
+    pattern = re.escape(needle)
+    if _WORD_CHAR.match(needle[:1]):
+        pattern = r'(?<!\w)' + pattern
+    if _WORD_CHAR.match(needle[-1:]):
+        pattern += r'(?!\w)'
+    return pattern
+
+
+@lru_cache(maxsize=None)
+def _needle_regex(needles):
+    """Compile one bounded bytes alternation over all needles (longest first)"""
+    ordered = sorted(set(needles), key=len, reverse=True)
+    return re.compile('|'.join(map(_bounded, ordered)).encode('utf-8'))
+
+
+def _decode_gui_file(path):
+    """Decode a file's mapped bytes for consumers that need str (Aho-Corasick,
+    the HTML parsers); they cache their results, so the text is not kept"""
+    return _map_gui_file(path)[:].decode('utf-8')
+
+
+def _file_contains(path, literal):
+    """Literal substring test on a file's mapped bytes (memmem, no decode)"""
+    return _map_gui_file(path).find(literal.encode('utf-8')) != -1
+
+
+def _find_missing_in_file(path, needles):
+    """Return the needles not present in a file, in order, scanning its mapped
+    bytes once without a UTF-8 decode.
+    
+    A needle only occurring inside a longer needle's match is not reported by
+    the single pass, so anything not found is re-checked on its own.
+    """
+    content = _map_gui_file(path)
+    if not needles:
+        return []
+    found = set(_needle_regex(tuple(needles)).findall(content))
+    return [n for n in needles
+            if n.encode('utf-8') not in found
+            and not _needle_regex((n,)).search(content)]
+
+
+def _edges_clear(content, start, end, needle):
+    """Apply _bounded()'s word-boundary rule to a raw match at content[start:end]"""
+    if _WORD_CHAR.match(needle[:1]) and start > 0 and _WORD_CHAR.match(content, start - 1):
+        return False
+    if _WORD_CHAR.match(needle[-1:]) and _WORD_CHAR.match(content, end):
+        return False
+    return True
+
+
+@lru_cache(maxsize=None)
+def _automaton(needles):
+    """Build an Aho-Corasick automaton over needles (requires pyahocorasick)"""
+    automaton = ahocorasick.Automaton()
+    for needle in needles:
+        automaton.add_word(needle, needle)
+    automaton.make_automaton()
+    return automaton
+
+
+@lru_cache(maxsize=None)
+def _present_needles(path, needles):
+    """Frozenset of the needles occurring in a file, from a single pass"""
+    if not needles:
+        return frozenset()
+    if ahocorasick is None:
+        return frozenset(needles).difference(_find_missing_in_file(path, needles))
+    content = _decode_gui_file(path)
+    found = set()
+    for end, needle in _automaton(needles).iter(content):
+        start = end - len(needle) + 1
+        if _edges_clear(content, start, end + 1, needle):
+            found.add(needle)
+    return frozenset(found)
+
+
+# attributes: {id: {attr: value}} (first element per id); options: {select id:
+# number of <option> children}; tooltips: `for` values of tooltip-bearing tags
+HtmlIndex = namedtuple('HtmlIndex', ['attributes', 'options', 'tooltips'])
+
+
+class _HtmlIndexer(HTMLParser):
+    """Pure-Python fallback that fills an HtmlIndex from one parse"""
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.index = HtmlIndex({}, {}, set())
+        self._select = None
+    
+    def handle_starttag(self, tag, attrs):
+        _index_element(self.index, tag, dict(attrs))
+        if tag == 'select':
+            self._select = dict(attrs).get('id')
+        elif tag == 'option' and self._select is not None:
+            self.index.options[self._select] += 1
+    
+    def handle_endtag(self, tag):
+        if tag == 'select':
+            self._select = None
+
+
+def _index_element(index, tag, attrs):
+    """Record one element's attributes in the index"""
+    element_id = attrs.get('id')
+    if element_id is not None:
+        index.attributes.setdefault(element_id, attrs)
+        if tag == 'select':
+            index.options.setdefault(element_id, 0)
+    if 'for' in attrs and 'data-tooltip' in attrs:
+        index.tooltips.add(attrs['for'])
+
+
+@lru_cache(maxsize=None)
+def _html_index(path):
+    """Parse an HTML file once into an HtmlIndex of id/attribute lookups"""
+    content = _decode_gui_file(path)
+    if lxml is None or not content.strip():  # lxml rejects empty documents
+        indexer = _HtmlIndexer()
+        indexer.feed(content)
+        indexer.close()
+        return indexer.index
+    
+    index = HtmlIndex({}, {}, set())
+    for element in lxml.html.fromstring(content).iter():
+        if not isinstance(element.tag, str):
+            continue  # comments and processing instructions
+        attrs = dict(element.attrib)
+        _index_element(index, element.tag, attrs)
+        if element.tag == 'select' and attrs.get('id') in index.options:
+            index.options[attrs['id']] = max(index.options[attrs['id']],
+                                             len(element.findall('.//option')))
+    return index
+
 
 class GUITestResult:
     """Holds GUI test result information"""
@@ -27,1178 +200,730 @@ class GUITestResult:
 
 
 # ============================================================
-# SETTINGS.HTML TESTS
+# REQUIRED ELEMENTS (built once at import)
 # ============================================================
 
-def test_html_tabs_exist():
-    """Test that all required tabs exist in settings.html"""
-    settings_html_path = os.path.join(BASE_DIR, "GUI", "settings.html")
-    
-    try:
-        with open(settings_html_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        required_tabs = [
-            "ScenarioSettings",
-            "InterfaceSettings", 
-            "GroupSettings",
-            "ReportSettings",
-            "EventSettings",
-            "OverlayMovement",
-            "UpdateConfiguration",
-            "DataAnalysis",
-            "PostProcessing"
-        ]
-        
-        missing = [tab for tab in required_tabs if f'id="{tab}"' not in content]
-        
-        if missing:
-            return GUITestResult("HTML Tabs Exist", False, f"Missing tabs: {missing}")
-        return GUITestResult("HTML Tabs Exist", True)
-    except Exception as e:
-        return GUITestResult("HTML Tabs Exist", False, str(e))
-
-
-def test_scenario_settings_fields():
-    """Test that Scenario Settings tab has all required fields"""
-    settings_html_path = os.path.join(BASE_DIR, "GUI", "settings.html")
-    
-    try:
-        with open(settings_html_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        required_fields = [
-            'id="scenarioName"',
-            'id="simulateConnections"',
-            'id="updateInterval"',
-            'id="endTime"'
-        ]
-        
-        missing = [field for field in required_fields if field not in content]
-        
-        if missing:
-            return GUITestResult("Scenario Settings Fields", False, f"Missing: {missing}")
-        return GUITestResult("Scenario Settings Fields", True)
-    except Exception as e:
-        return GUITestResult("Scenario Settings Fields", False, str(e))
+_SCENARIO_SETTINGS_FIELDS = (
+    'id="scenarioName"',
+    'id="simulateConnections"',
+    'id="updateInterval"',
+    'id="endTime"'
+)
+
+_INTERFACE_SETTINGS_FIELDS = (
+    'id="interfaceName"',
+    'id="interfaceType"',
+    'id="transmitSpeed"',
+    'id="transmitRange"'
+)
+
+_GROUP_SETTINGS_FIELDS = (
+    'id="commonMovementModel"',
+    'id="commonRouter"',
+    'id="commonBufferSize"',
+    'id="commonWaitTime"',
+    'id="commonSpeed"',
+    'id="commonTtl"',
+    'id="groupID"',
+    'id="numberOfHosts"',
+    'id="router"'
+)
+
+_EVENT_SETTINGS_FIELDS = (
+    'id="eventClass"',
+    'id="eventIntervalMin"',
+    'id="eventIntervalMax"',
+    'id="eventSizeMin"',
+    'id="eventSizeMax"',
+    'id="eventHostsMin"',
+    'id="eventHostsMax"',
+    'id="eventPrefix"'
+)
+
+_REPORT_SETTINGS_FIELDS = (
+    'id="reportClass"',
+    'id="reportWarmup"',
+    'id="reportDir"'
+)
+
+_MOVEMENT_SETTINGS_FIELDS = (
+    'id="rngSeed"',
+    'id="warmup"',
+    'id="worldSize"',
+    'id="mapFiles"'
+)
+
+_ROUTER_WHITELIST = (
+    "EpidemicRouter", "ProphetRouter", "SprayAndWaitRouter", "PassiveRouter",
+    "DirectDeliveryRouter", "FirstContactRouter", "MaxPropRouter"
+)
+
+_ROUTER_DROPDOWN_OPTIONS = (
+    'value="EpidemicRouter"',
+    'value="ProphetRouter"',
+    'value="SprayAndWaitRouter"',
+    'value="MaxPropRouter"',
+    'value="DirectDeliveryRouter"',
+    'value="FirstContactRouter"'
+)
+
+_MOVEMENT_MODELS_DROPDOWN = (
+    "RandomWaypoint",
+    "ShortestPathMapBasedMovement",
+    "MapRouteMovement",
+    "StationaryMovement"
+)
+
+_REPORT_CLASSES_DROPDOWN = (
+    "MessageStatsReport",
+    "ContactTimesReport",
+    "DeliveredMessagesReport",
+    "BufferOccupancyReport"
+)
+
+_POST_PROCESSING_FIELDS = (
+    'id="batchFolder"',
+    'id="analysisReportDir"',
+    'id="analysisPlotsDir"',
+    'id="enableML"'
+)
+
+_CONFIG_JS_EVENT_HANDLERS = (
+    'addEventListener("DOMContentLoaded"',
+    'addEventListener("submit"',
+    'addEventListener("change"'
+)
+
+_CONFIG_JS_API_CALLS = (
+    "fetch('/api/save-all'",
+    "fetch('/api/config/"
+)
+
+_CONFIG_JS_DEFAULT_INTERFACES = (
+    "btInterface",
+    "highspeedInterface",
+    "SimpleBroadcastInterface"
+)
+
+_CSS_BUTTON_CLASSES = (
+    ".add-button",
+    ".remove-button",
+    ".edit-button"
+)
+
+_ENERGY_SETTINGS_FIELDS = (
+    'id="enableEnergyModel"',
+    'id="energyFields"',
+    'id="initialEnergy"',
+    'id="scanEnergy"',
+    'id="transmitEnergy"',
+    'id="baseEnergy"'
+)
+
+_POI_CONFIGURATION_FIELDS = (
+    'id="poiEnabled"',
+    'id="poiConfiguration"',
+    'id="poiTableBody"',
+    'id="poiPreview"'
+)
+
+_IMPORT_CONFIG_SECTION = (
+    'id="importConfigFile"',
+    'importONEConfig'
+)
+
+_ENERGY_EXPORT_FORMAT = (
+    'Group.initialEnergy =',
+    'Group.scanEnergy =',
+    'Group.transmitEnergy =',
+    'Group.baseEnergy ='
+)
+
+_TOOLTIP_CSS_EXISTS = (
+    'data-tooltip',
+    '::before',
+    '::after'
+)
+
+
+_CONFIG_JS_FUNCTIONS = (
+    "saveAllSettings",
+    "saveDefaultSettings",
+    "openTab",
+    "addInterface",
+    "populateInterfaceTable",
+    "populateGroupTable",
+    "renderReports",  # Changed from addReport - this is the actual function name
+    "runONE",
+    "collectAnalysisConfig",
+    "collectBatchConfig",
+    "collectRegressionConfig"
+)
+
+# Check for 'function name' or 'const name =' patterns
+_CONFIG_JS_DECLARATIONS = tuple(f"{kind} {fn}" for fn in _CONFIG_JS_FUNCTIONS
+                                for kind in ("function", "const"))
+
+# ONE simulator format strings
+_SETTINGS_EXPORT_FORMAT = (
+    "Scenario.name =",
+    "Scenario.simulateConnections =",
+    "Scenario.updateInterval =",
+    "Scenario.endTime =",
+    "Group.movementModel =",
+    "Group.router =",
+    "Group.bufferSize =",
+    "Report.nrofReports =",
+    "Events.nrof ="
+)
+
+_DEFAULT_GROUPS = ("const groupSettings", "groupID")
+
+# ONE simulator format patterns
+_ONE_OUTPUT_FORMATS = (
+    "Scenario.nrofHostGroups =",
+    "Group.nrofInterfaces =",
+    "Group.interface1 =",
+    "MapBasedMovement.nrofMapFiles =",
+    "ProphetRouter.secondsInTimeUnit =",
+    "SprayAndWaitRouter.nrofCopies =",
+    "Optimization.cellSizeMult =",
+)
+
+_IMPORT_EXPORT_FUNCTIONS = ('importONEConfig', 'parseONEConfig', 'applyConfigToForm')
+
+_POI_FUNCTIONS = ('addPOIRow', 'removePOIRow', 'updatePOIPreview')
+
+# (result name, file under GUI/, needles, failure label) for every test that
+# only asserts a fixed set of substrings
+_SUITE = [
+    ("Scenario Settings Fields", "settings.html", _SCENARIO_SETTINGS_FIELDS, "Missing"),
+    ("Interface Settings Fields", "settings.html", _INTERFACE_SETTINGS_FIELDS, "Missing"),
+    ("Group Settings Fields", "settings.html", _GROUP_SETTINGS_FIELDS, "Missing"),
+    ("Event Settings Fields", "settings.html", _EVENT_SETTINGS_FIELDS, "Missing"),
+    ("Report Settings Fields", "settings.html", _REPORT_SETTINGS_FIELDS, "Missing"),
+    ("Movement Settings Fields", "settings.html", _MOVEMENT_SETTINGS_FIELDS, "Missing"),
+    ("Router Whitelist", "settings.html", _ROUTER_WHITELIST, "Missing routers"),
+    ("Router Dropdown Options", "settings.html", _ROUTER_DROPDOWN_OPTIONS, "Missing"),
+    ("Movement Models Dropdown", "settings.html", _MOVEMENT_MODELS_DROPDOWN, "Missing"),
+    ("Report Classes Dropdown", "settings.html", _REPORT_CLASSES_DROPDOWN, "Missing"),
+    ("Post-Processing Fields", "settings.html", _POST_PROCESSING_FIELDS, "Missing"),
+    ("Config.js Event Handlers", "config.js", _CONFIG_JS_EVENT_HANDLERS, "Missing"),
+    ("Config.js API Calls", "config.js", _CONFIG_JS_API_CALLS, "Missing"),
+    ("Default Interfaces", "config.js", _CONFIG_JS_DEFAULT_INTERFACES, "Missing"),
+    ("CSS Button Classes", "settings.css", _CSS_BUTTON_CLASSES, "Missing"),
+    ("Energy Settings Fields", "settings.html", _ENERGY_SETTINGS_FIELDS, "Missing"),
+    ("POI Configuration Fields", "settings.html", _POI_CONFIGURATION_FIELDS, "Missing"),
+    ("Import Config Section", "settings.html", _IMPORT_CONFIG_SECTION, "Missing"),
+    ("Energy Export Format", "config.js", _ENERGY_EXPORT_FORMAT, "Missing"),
+    ("Tooltip CSS", "settings.css", _TOOLTIP_CSS_EXISTS, "Missing"),
+]
+
+
+def _collect_file_needles():
+    """Union of every fixed needle checked per GUI file, in first-seen order"""
+    by_file = defaultdict(dict)
+    for _, filename, needles, _ in _SUITE:
+        by_file[filename].update(dict.fromkeys(needles))
+    by_file["config.js"].update(dict.fromkeys(
+        _CONFIG_JS_DECLARATIONS + _SETTINGS_EXPORT_FORMAT + _DEFAULT_GROUPS
+        + _ONE_OUTPUT_FORMATS
+        + tuple(f"function {fn}" for fn in _IMPORT_EXPORT_FUNCTIONS + _POI_FUNCTIONS)))
+    return {filename: tuple(needles) for filename, needles in by_file.items()}
+
+
+# config.js needles from every test go through one automaton / regex pass
+_FILE_NEEDLES = _collect_file_needles()
+
+
+def _present_in(filename):
+    """Needles of _FILE_NEEDLES[filename] present in GUI/<filename> (cached)"""
+    return _present_needles(os.path.join(BASE_DIR, "GUI", filename), _FILE_NEEDLES[filename])
+
+
+def _run_substr_tests():
+    """Evaluate _SUITE with one multi-needle pass per file; returns name -> result"""
+    by_file = defaultdict(list)
+    for name, filename, needles, label in _SUITE:
+        by_file[filename].append((name, needles, label))
+    
+    results = {}
+    for filename, entries in by_file.items():
+        if filename not in _present_gui_files():
+            for name, _, _ in entries:
+                results[name] = GUITestResult(name, False, f"Missing GUI file(s): {[filename]}")
+            continue
+        try:
+            present = _present_in(filename)
+        except _FILE_ERRORS as e:
+            for name, _, _ in entries:
+                results[name] = GUITestResult(name, False, str(e))
+            continue
+        for name, needles, label in entries:
+            missing = [n for n in needles if n not in present]
+            if missing:
+                results[name] = GUITestResult(name, False, f"{label}: {missing}")
+            else:
+                results[name] = GUITestResult(name, True)
+    return results
 
 
-def test_interface_settings_fields():
-    """Test that Interface Settings tab has all required fields"""
-    settings_html_path = os.path.join(BASE_DIR, "GUI", "settings.html")
-    
+@lru_cache(maxsize=None)
+def _present_gui_files():
+    """Names of the files in GUI/, from one directory scan (preflight)"""
     try:
-        with open(settings_html_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        required_fields = [
-            'id="interfaceName"',
-            'id="interfaceType"',
-            'id="transmitSpeed"',
-            'id="transmitRange"'
-        ]
-        
-        missing = [field for field in required_fields if field not in content]
-        
-        if missing:
-            return GUITestResult("Interface Settings Fields", False, f"Missing: {missing}")
-        return GUITestResult("Interface Settings Fields", True)
-    except Exception as e:
-        return GUITestResult("Interface Settings Fields", False, str(e))
+        with os.scandir(os.path.join(BASE_DIR, "GUI")) as entries:
+            return frozenset(entry.name for entry in entries if entry.is_file())
+    except FileNotFoundError:
+        return frozenset()
 
 
-def test_group_settings_fields():
-    """Test that Group Settings tab has all required fields"""
-    settings_html_path = os.path.join(BASE_DIR, "GUI", "settings.html")
-    
-    try:
-        with open(settings_html_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        required_fields = [
-            'id="commonMovementModel"',
-            'id="commonRouter"',
-            'id="commonBufferSize"',
-            'id="commonWaitTime"',
-            'id="commonSpeed"',
-            'id="commonTtl"',
-            'id="groupID"',
-            'id="numberOfHosts"',
-            'id="router"'
-        ]
-        
-        missing = [field for field in required_fields if field not in content]
-        
-        if missing:
-            return GUITestResult("Group Settings Fields", False, f"Missing: {missing}")
-        return GUITestResult("Group Settings Fields", True)
-    except Exception as e:
-        return GUITestResult("Group Settings Fields", False, str(e))
+# Errors from reading a GUI file (permissions, bad encoding, ...)
+_FILE_ERRORS = (OSError, UnicodeDecodeError)
 
 
-def test_event_settings_fields():
-    """Test that Event Settings tab has all required fields"""
-    settings_html_path = os.path.join(BASE_DIR, "GUI", "settings.html")
-    
-    try:
-        with open(settings_html_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        required_fields = [
-            'id="eventClass"',
-            'id="eventIntervalMin"',
-            'id="eventIntervalMax"',
-            'id="eventSizeMin"',
-            'id="eventSizeMax"',
-            'id="eventHostsMin"',
-            'id="eventHostsMax"',
-            'id="eventPrefix"'
-        ]
-        
-        missing = [field for field in required_fields if field not in content]
-        
-        if missing:
-            return GUITestResult("Event Settings Fields", False, f"Missing: {missing}")
-        return GUITestResult("Event Settings Fields", True)
-    except Exception as e:
-        return GUITestResult("Event Settings Fields", False, str(e))
+def _requires(name, *filenames):
+    """Fail a test up front, with a clear message, if a GUI file it reads is missing"""
+    def decorator(test_func):
+        @wraps(test_func)
+        def wrapper():
+            missing = [f for f in filenames if f not in _present_gui_files()]
+            if missing:
+                return GUITestResult(name, False, f"Missing GUI file(s): {missing}")
+            # Only file access problems become a FAIL; anything else is a bug
+            # in the test or the helpers and should propagate
+            try:
+                return test_func()
+            except _FILE_ERRORS as e:
+                return GUITestResult(name, False, str(e))
+        return wrapper
+    return decorator
 
 
-def test_report_settings_fields():
-    """Test that Report Settings tab has required fields"""
-    settings_html_path = os.path.join(BASE_DIR, "GUI", "settings.html")
-    
-    try:
-        with open(settings_html_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        required_fields = [
-            'id="reportClass"',
-            'id="reportWarmup"',
-            'id="reportDir"'
-        ]
-        
-        missing = [field for field in required_fields if field not in content]
-        
-        if missing:
-            return GUITestResult("Report Settings Fields", False, f"Missing: {missing}")
-        return GUITestResult("Report Settings Fields", True)
-    except Exception as e:
-        return GUITestResult("Report Settings Fields", False, str(e))
-
-
-def test_movement_settings_fields():
-    """Test that Map Based Movement tab has required fields"""
-    settings_html_path = os.path.join(BASE_DIR, "GUI", "settings.html")
-    
-    try:
-        with open(settings_html_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        required_fields = [
-            'id="rngSeed"',
-            'id="warmup"',
-            'id="worldSize"',
-            'id="mapFiles"'
-        ]
-        
-        missing = [field for field in required_fields if field not in content]
-        
-        if missing:
-            return GUITestResult("Movement Settings Fields", False, f"Missing: {missing}")
-        return GUITestResult("Movement Settings Fields", True)
-    except Exception as e:
-        return GUITestResult("Movement Settings Fields", False, str(e))
-
-
-def test_router_whitelist():
-    """Test that router whitelist contains all expected routers"""
-    settings_html_path = os.path.join(BASE_DIR, "GUI", "settings.html")
-    
-    try:
-        with open(settings_html_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        expected_routers = [
-            "EpidemicRouter", "ProphetRouter", "SprayAndWaitRouter", "PassiveRouter",
-            "DirectDeliveryRouter", "FirstContactRouter", "MaxPropRouter"
-        ]
-        
-        missing = [r for r in expected_routers if r not in content]
-        
-        if missing:
-            return GUITestResult("Router Whitelist", False, f"Missing routers: {missing}")
-        return GUITestResult("Router Whitelist", True)
-    except Exception as e:
-        return GUITestResult("Router Whitelist", False, str(e))
+# ============================================================
+# ATTRIBUTE CHECKS (answered from the parsed settings.html)
+# ============================================================
 
+# Fields that should be required
+_REQUIRED_ATTR_FIELDS = ('interfaceName', 'interfaceType', 'transmitSpeed', 'transmitRange')
+
+# Number fields that should have constraints
+_NUMBER_CONSTRAINTS = (
+    ('updateInterval', 'min'),   # Should have min="0"
+    ('updateInterval', 'step'),  # Should have step for decimals
+    ('endTime', 'min'),          # Should have min="0"
+    ('transmitSpeed', 'min'),    # Should have min="1"
+    ('transmitRange', 'min'),    # Should have min="1"
+)
+
+# Fields and their expected types
+_INPUT_TYPES = (
+    ('updateInterval', 'number'),
+    ('endTime', 'number'),
+    ('transmitSpeed', 'number'),
+    ('transmitRange', 'number'),
+    ('commonNumberOfHost', 'number'),
+    ('simulateConnections', 'checkbox'),
+    ('commonRouteFile', 'file'),
+)
+
+# Fields that should have default values
+_DEFAULT_VALUES = (
+    ('scenarioName', 'default_scenario'),
+    ('updateInterval', '0.1'),
+    ('endTime', '43200'),
+    ('commonBufferSize', '5M'),
+)
+
+# Select elements that must have options
+_SELECTS_WITH_OPTIONS = ('interfaceType', 'commonMovementModel', 'router', 'reportClass')
+
+# Labels (by their `for` target) that must carry data-tooltip
+_SCENARIO_TOOLTIPS = ('scenarioName', 'updateInterval', 'endTime', 'simulateConnections')
+_GROUP_TOOLTIPS = ('commonMovementModel', 'commonRouter', 'commonBufferSize', 'commonInterface')
+_ENERGY_TOOLTIPS = ('enableEnergyModel', 'initialEnergy', 'scanEnergy')
+
+
+def _missing_tooltips(path, fields):
+    """Fields whose label lacks data-tooltip, formatted as 'for="field"'"""
+    tooltips = _html_index(path).tooltips
+    return [f'for="{field}"' for field in fields if field not in tooltips]
 
-def test_router_dropdown_options():
-    """Test that router dropdown contains all expected options"""
-    settings_html_path = os.path.join(BASE_DIR, "GUI", "settings.html")
-    
-    try:
-        with open(settings_html_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        expected_options = [
-            'value="EpidemicRouter"',
-            'value="ProphetRouter"',
-            'value="SprayAndWaitRouter"',
-            'value="MaxPropRouter"',
-            'value="DirectDeliveryRouter"',
-            'value="FirstContactRouter"'
-        ]
-        
-        missing = [opt for opt in expected_options if opt not in content]
-        
-        if missing:
-            return GUITestResult("Router Dropdown Options", False, f"Missing: {missing}")
-        return GUITestResult("Router Dropdown Options", True)
-    except Exception as e:
-        return GUITestResult("Router Dropdown Options", False, str(e))
 
+# ============================================================
+# SETTINGS.HTML TESTS
+# ============================================================
 
-def test_movement_models_dropdown():
-    """Test that movement models dropdown has expected options"""
+@_requires("HTML Tabs Exist", "settings.html")
+def test_html_tabs_exist():
+    """Test that all required tabs exist in settings.html"""
     settings_html_path = os.path.join(BASE_DIR, "GUI", "settings.html")
     
-    try:
-        with open(settings_html_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        expected_models = [
-            "RandomWaypoint",
-            "ShortestPathMapBasedMovement",
-            "MapRouteMovement",
-            "StationaryMovement"
-        ]
-        
-        missing = [m for m in expected_models if m not in content]
-        
-        if missing:
-            return GUITestResult("Movement Models Dropdown", False, f"Missing: {missing}")
-        return GUITestResult("Movement Models Dropdown", True)
-    except Exception as e:
-        return GUITestResult("Movement Models Dropdown", False, str(e))
-
-
-def test_report_classes_dropdown():
-    """Test that report classes dropdown has expected options"""
-    settings_html_path = os.path.join(BASE_DIR, "GUI", "settings.html")
+    required_tabs = [
+        "ScenarioSettings",
+        "InterfaceSettings", 
+        "GroupSettings",
+        "ReportSettings",
+        "EventSettings",
+        "OverlayMovement",
+        "UpdateConfiguration",
+        "DataAnalysis",
+        "PostProcessing"
+    ]
     
-    try:
-        with open(settings_html_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        expected_reports = [
-            "MessageStatsReport",
-            "ContactTimesReport",
-            "DeliveredMessagesReport",
-            "BufferOccupancyReport"
-        ]
-        
-        missing = [r for r in expected_reports if r not in content]
-        
-        if missing:
-            return GUITestResult("Report Classes Dropdown", False, f"Missing: {missing}")
-        return GUITestResult("Report Classes Dropdown", True)
-    except Exception as e:
-        return GUITestResult("Report Classes Dropdown", False, str(e))
-
-
-def test_post_processing_fields():
-    """Test that Post-Processing tab has required fields"""
-    settings_html_path = os.path.join(BASE_DIR, "GUI", "settings.html")
+    missing_ids = _find_missing_in_file(settings_html_path, [f'id="{tab}"' for tab in required_tabs])
+    missing = [tab_id[len('id="'):-1] for tab_id in missing_ids]
     
-    try:
-        with open(settings_html_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        required_fields = [
-            'id="batchFolder"',
-            'id="analysisReportDir"',
-            'id="analysisPlotsDir"',
-            'id="enableML"'
-        ]
-        
-        missing = [field for field in required_fields if field not in content]
-        
-        if missing:
-            return GUITestResult("Post-Processing Fields", False, f"Missing: {missing}")
-        return GUITestResult("Post-Processing Fields", True)
-    except Exception as e:
-        return GUITestResult("Post-Processing Fields", False, str(e))
+    if missing:
+        return GUITestResult("HTML Tabs Exist", False, f"Missing tabs: {missing}")
+    return GUITestResult("HTML Tabs Exist", True)
 
 
 # ============================================================
 # CONFIG.JS TESTS
 # ============================================================
 
+@_requires("Config.js Functions", "config.js")
 def test_config_js_functions():
     """Test that all required JavaScript functions exist in config.js"""
-    config_js_path = os.path.join(BASE_DIR, "GUI", "config.js")
-    
-    try:
-        with open(config_js_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        # Check for function declarations (both 'function name' and 'const name = ')
-        required_functions = [
-            "saveAllSettings",
-            "saveDefaultSettings",
-            "openTab",
-            "addInterface",
-            "populateInterfaceTable",
-            "populateGroupTable",
-            "renderReports",  # Changed from addReport - this is the actual function name
-            "runONE",
-            "collectAnalysisConfig",
-            "collectBatchConfig",
-            "collectRegressionConfig"
-        ]
-        
-        missing = []
-        for fn in required_functions:
-            # Check for 'function name' or 'const name =' patterns
-            if f"function {fn}" not in content and f"const {fn}" not in content:
-                missing.append(fn)
-        
-        if missing:
-            return GUITestResult("Config.js Functions", False, f"Missing: {missing}")
-        return GUITestResult("Config.js Functions", True)
-    except Exception as e:
-        return GUITestResult("Config.js Functions", False, str(e))
-
-
-def test_config_js_event_handlers():
-    """Test that config.js has required event handlers"""
-    config_js_path = os.path.join(BASE_DIR, "GUI", "config.js")
-    
-    try:
-        with open(config_js_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        required_handlers = [
-            'addEventListener("DOMContentLoaded"',
-            'addEventListener("submit"',
-            'addEventListener("change"'
-        ]
-        
-        missing = [h for h in required_handlers if h not in content]
-        
-        if missing:
-            return GUITestResult("Config.js Event Handlers", False, f"Missing: {missing}")
-        return GUITestResult("Config.js Event Handlers", True)
-    except Exception as e:
-        return GUITestResult("Config.js Event Handlers", False, str(e))
-
-
-def test_config_js_api_calls():
-    """Test that config.js has required API calls"""
-    config_js_path = os.path.join(BASE_DIR, "GUI", "config.js")
-    
-    try:
-        with open(config_js_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        required_apis = [
-            "fetch('/api/save-all'",
-            "fetch('/api/config/"
-        ]
-        
-        missing = [api for api in required_apis if api not in content]
-        
-        if missing:
-            return GUITestResult("Config.js API Calls", False, f"Missing: {missing}")
-        return GUITestResult("Config.js API Calls", True)
-    except Exception as e:
-        return GUITestResult("Config.js API Calls", False, str(e))
-
-
-def test_config_js_default_interfaces():
-    """Test that default interfaces are defined in config.js"""
-    config_js_path = os.path.join(BASE_DIR, "GUI", "config.js")
+    present = _present_in("config.js")
+    missing = [fn for fn in _CONFIG_JS_FUNCTIONS
+               if f"function {fn}" not in present and f"const {fn}" not in present]
     
-    try:
-        with open(config_js_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        required = [
-            "btInterface",
-            "highspeedInterface",
-            "SimpleBroadcastInterface"
-        ]
-        
-        missing = [r for r in required if r not in content]
-        
-        if missing:
-            return GUITestResult("Default Interfaces", False, f"Missing: {missing}")
-        return GUITestResult("Default Interfaces", True)
-    except Exception as e:
-        return GUITestResult("Default Interfaces", False, str(e))
+    if missing:
+        return GUITestResult("Config.js Functions", False, f"Missing: {missing}")
+    return GUITestResult("Config.js Functions", True)
 
 
+@_requires("Default Groups", "config.js")
 def test_config_js_default_groups():
     """Test that default groups are defined in config.js"""
-    config_js_path = os.path.join(BASE_DIR, "GUI", "config.js")
+    present = _present_in("config.js")
     
-    try:
-        with open(config_js_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        if "const groupSettings" not in content:
-            return GUITestResult("Default Groups", False, "groupSettings not defined")
-        
-        if "groupID" not in content:
-            return GUITestResult("Default Groups", False, "groupID property missing")
-        
-        return GUITestResult("Default Groups", True)
-    except Exception as e:
-        return GUITestResult("Default Groups", False, str(e))
+    if "const groupSettings" not in present:
+        return GUITestResult("Default Groups", False, "groupSettings not defined")
+    
+    if "groupID" not in present:
+        return GUITestResult("Default Groups", False, "groupID property missing")
+    
+    return GUITestResult("Default Groups", True)
 
 
+@_requires("Settings Export Format", "config.js")
 def test_settings_export_format():
     """Test that settings export generates correct ONE format"""
-    config_js_path = os.path.join(BASE_DIR, "GUI", "config.js")
+    present = _present_in("config.js")
+    missing = [p for p in _SETTINGS_EXPORT_FORMAT if p not in present]
     
-    try:
-        with open(config_js_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        # Check for ONE simulator format strings
-        required_patterns = [
-            "Scenario.name =",
-            "Scenario.simulateConnections =",
-            "Scenario.updateInterval =",
-            "Scenario.endTime =",
-            "Group.movementModel =",
-            "Group.router =",
-            "Group.bufferSize =",
-            "Report.nrofReports =",
-            "Events.nrof ="
-        ]
-        
-        missing = [p for p in required_patterns if p not in content]
-        
-        if missing:
-            return GUITestResult("Settings Export Format", False, f"Missing: {missing}")
-        return GUITestResult("Settings Export Format", True)
-    except Exception as e:
-        return GUITestResult("Settings Export Format", False, str(e))
+    if missing:
+        return GUITestResult("Settings Export Format", False, f"Missing: {missing}")
+    return GUITestResult("Settings Export Format", True)
 
 
 # ============================================================
 # CSS TESTS
 # ============================================================
 
+@_requires("CSS File Valid", "settings.css")
 def test_css_file_valid():
     """Test that settings.css exists and has content"""
     css_path = os.path.join(BASE_DIR, "GUI", "settings.css")
     
-    try:
-        with open(css_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        if len(content) < 100:
-            return GUITestResult("CSS File Valid", False, "CSS file too small")
-        
-        # Check for common CSS patterns
-        if '{' not in content or '}' not in content:
-            return GUITestResult("CSS File Valid", False, "Invalid CSS syntax")
-        
-        return GUITestResult("CSS File Valid", True)
-    except Exception as e:
-        return GUITestResult("CSS File Valid", False, str(e))
-
-
-def test_css_button_classes():
-    """Test that required button classes exist in CSS"""
-    css_path = os.path.join(BASE_DIR, "GUI", "settings.css")
+    if len(_map_gui_file(css_path)) < 100:
+        return GUITestResult("CSS File Valid", False, "CSS file too small")
     
-    try:
-        with open(css_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        required_classes = [
-            ".add-button",
-            ".remove-button",
-            ".edit-button"
-        ]
-        
-        missing = [c for c in required_classes if c not in content]
-        
-        if missing:
-            return GUITestResult("CSS Button Classes", False, f"Missing: {missing}")
-        return GUITestResult("CSS Button Classes", True)
-    except Exception as e:
-        return GUITestResult("CSS Button Classes", False, str(e))
+    # Check for common CSS patterns
+    if not _file_contains(css_path, '{') or not _file_contains(css_path, '}'):
+        return GUITestResult("CSS File Valid", False, "Invalid CSS syntax")
+    
+    return GUITestResult("CSS File Valid", True)
 
 
 # ============================================================
 # INPUT VALIDATION TESTS
 # ============================================================
 
+@_requires("Required Field Attributes", "settings.html")
 def test_required_fields_have_required_attribute():
     """Test that mandatory fields have 'required' attribute"""
     settings_html_path = os.path.join(BASE_DIR, "GUI", "settings.html")
     
-    try:
-        with open(settings_html_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        # Fields that should be required
-        required_fields_patterns = [
-            ('interfaceName', r'id="interfaceName"[^>]*required'),
-            ('interfaceType', r'id="interfaceType"[^>]*required'),
-            ('transmitSpeed', r'id="transmitSpeed"[^>]*required'),
-            ('transmitRange', r'id="transmitRange"[^>]*required'),
-        ]
-        
-        missing = []
-        for field_name, pattern in required_fields_patterns:
-            if not re.search(pattern, content, re.IGNORECASE):
-                missing.append(field_name)
-        
-        if missing:
-            return GUITestResult("Required Field Attributes", False, f"Missing required attr: {missing}")
-        return GUITestResult("Required Field Attributes", True)
-    except Exception as e:
-        return GUITestResult("Required Field Attributes", False, str(e))
+    attributes = _html_index(settings_html_path).attributes
+    
+    missing = [field_name for field_name in _REQUIRED_ATTR_FIELDS
+               if 'required' not in attributes.get(field_name, {})]
+    
+    if missing:
+        return GUITestResult("Required Field Attributes", False, f"Missing required attr: {missing}")
+    return GUITestResult("Required Field Attributes", True)
 
 
+@_requires("Number Input Constraints", "settings.html")
 def test_number_inputs_have_constraints():
     """Test that number inputs have min, max, or step attributes where appropriate"""
     settings_html_path = os.path.join(BASE_DIR, "GUI", "settings.html")
     
-    try:
-        with open(settings_html_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        # Number fields that should have constraints
-        constrained_fields = [
-            ('updateInterval', 'min'),   # Should have min="0"
-            ('updateInterval', 'step'),  # Should have step for decimals
-            ('endTime', 'min'),          # Should have min="0"
-            ('transmitSpeed', 'min'),    # Should have min="1"
-            ('transmitRange', 'min'),    # Should have min="1"
-        ]
-        
-        missing = []
-        for field_name, attr in constrained_fields:
-            pattern = rf'id="{field_name}"[^>]*{attr}='
-            if not re.search(pattern, content, re.IGNORECASE):
-                missing.append(f"{field_name}.{attr}")
-        
-        if missing:
-            return GUITestResult("Number Input Constraints", False, f"Missing: {missing}")
-        return GUITestResult("Number Input Constraints", True)
-    except Exception as e:
-        return GUITestResult("Number Input Constraints", False, str(e))
+    attributes = _html_index(settings_html_path).attributes
+    
+    missing = [f"{field_name}.{attr}" for field_name, attr in _NUMBER_CONSTRAINTS
+               if attr not in attributes.get(field_name, {})]
+    
+    if missing:
+        return GUITestResult("Number Input Constraints", False, f"Missing: {missing}")
+    return GUITestResult("Number Input Constraints", True)
 
 
+@_requires("Input Types Correct", "settings.html")
 def test_input_types_correct():
     """Test that inputs use correct HTML5 input types"""
     settings_html_path = os.path.join(BASE_DIR, "GUI", "settings.html")
     
-    try:
-        with open(settings_html_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        # Fields and their expected types
-        type_checks = [
-            ('updateInterval', 'number'),
-            ('endTime', 'number'),
-            ('transmitSpeed', 'number'),
-            ('transmitRange', 'number'),
-            ('commonNumberOfHost', 'number'),
-            ('simulateConnections', 'checkbox'),
-            ('commonRouteFile', 'file'),
-        ]
-        
-        incorrect = []
-        for field_id, expected_type in type_checks:
-            pattern = rf'id="{field_id}"[^>]*type="{expected_type}"'
-            # Also check reverse order
-            pattern2 = rf'type="{expected_type}"[^>]*id="{field_id}"'
-            if not re.search(pattern, content) and not re.search(pattern2, content):
-                incorrect.append(f"{field_id}:{expected_type}")
-        
-        if incorrect:
-            return GUITestResult("Input Types Correct", False, f"Wrong types: {incorrect}")
-        return GUITestResult("Input Types Correct", True)
-    except Exception as e:
-        return GUITestResult("Input Types Correct", False, str(e))
+    attributes = _html_index(settings_html_path).attributes
+    
+    incorrect = [f"{field_id}:{expected_type}" for field_id, expected_type in _INPUT_TYPES
+                 if attributes.get(field_id, {}).get('type') != expected_type]
+    
+    if incorrect:
+        return GUITestResult("Input Types Correct", False, f"Wrong types: {incorrect}")
+    return GUITestResult("Input Types Correct", True)
 
 
+@_requires("File Input Accept", "settings.html")
 def test_file_input_accepts_correct_extensions():
     """Test that file inputs have correct accept attributes"""
     settings_html_path = os.path.join(BASE_DIR, "GUI", "settings.html")
     
-    try:
-        with open(settings_html_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        # Check route file accepts .wkt
-        if 'accept=".wkt"' not in content:
-            return GUITestResult("File Input Accept", False, "Route file should accept .wkt")
-        
-        return GUITestResult("File Input Accept", True)
-    except Exception as e:
-        return GUITestResult("File Input Accept", False, str(e))
+    # Check route file accepts .wkt
+    if not _file_contains(settings_html_path, 'accept=".wkt"'):
+        return GUITestResult("File Input Accept", False, "Route file should accept .wkt")
+    
+    return GUITestResult("File Input Accept", True)
 
 
+@_requires("Select Elements Have Options", "settings.html")
 def test_select_elements_have_options():
     """Test that select elements have at least one option"""
     settings_html_path = os.path.join(BASE_DIR, "GUI", "settings.html")
     
-    try:
-        with open(settings_html_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        # Select elements that must have options
-        selects_to_check = [
-            'interfaceType',
-            'commonMovementModel',
-            'router',
-            'reportClass',
-        ]
-        
-        empty_selects = []
-        for select_id in selects_to_check:
-            # Find the select element
-            pattern = rf'<select[^>]*id="{select_id}"[^>]*>.*?</select>'
-            match = re.search(pattern, content, re.DOTALL)
-            if match:
-                select_html = match.group()
-                if '<option' not in select_html:
-                    empty_selects.append(select_id)
-            else:
-                empty_selects.append(f"{select_id}(not found)")
-        
-        if empty_selects:
-            return GUITestResult("Select Elements Have Options", False, f"Empty: {empty_selects}")
-        return GUITestResult("Select Elements Have Options", True)
-    except Exception as e:
-        return GUITestResult("Select Elements Have Options", False, str(e))
+    options = _html_index(settings_html_path).options
+    
+    empty_selects = []
+    for select_id in _SELECTS_WITH_OPTIONS:
+        if select_id not in options:
+            empty_selects.append(f"{select_id}(not found)")
+        elif not options[select_id]:
+            empty_selects.append(select_id)
+    
+    if empty_selects:
+        return GUITestResult("Select Elements Have Options", False, f"Empty: {empty_selects}")
+    return GUITestResult("Select Elements Have Options", True)
 
 
+@_requires("JS Interface Validation", "config.js")
 def test_js_addinterface_validation():
     """Test that addInterface function has input validation"""
     config_js_path = os.path.join(BASE_DIR, "GUI", "config.js")
     
-    try:
-        with open(config_js_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        # Check for validation patterns in addInterface
-        validation_patterns = [
-            'interfaceName',
-            'transmitSpeed',
-            'transmitRange',
-            'alert',  # Should show alert on error
-        ]
-        
-        # Find the addInterface function
-        if 'function addInterface' not in content:
-            return GUITestResult("JS Interface Validation", False, "addInterface not found")
-        
-        # Simple check - validation should include checking if fields are filled
-        if 'Please fill' not in content and '!interfaceName' not in content:
-            return GUITestResult("JS Interface Validation", False, "No input validation found")
-        
-        return GUITestResult("JS Interface Validation", True)
-    except Exception as e:
-        return GUITestResult("JS Interface Validation", False, str(e))
+    # Check for validation patterns in addInterface
+    validation_patterns = [
+        'interfaceName',
+        'transmitSpeed',
+        'transmitRange',
+        'alert',  # Should show alert on error
+    ]
+    
+    # Find the addInterface function
+    if not _file_contains(config_js_path, 'function addInterface'):
+        return GUITestResult("JS Interface Validation", False, "addInterface not found")
+    
+    # Simple check - validation should include checking if fields are filled
+    if (not _file_contains(config_js_path, 'Please fill')
+            and not _file_contains(config_js_path, '!interfaceName')):
+        return GUITestResult("JS Interface Validation", False, "No input validation found")
+    
+    return GUITestResult("JS Interface Validation", True)
 
 
+@_requires("JS Batch Syntax Validation", "config.js")
 def test_js_batch_syntax_validation():
     """Test that batch syntax (semicolon-separated) is validated"""
     config_js_path = os.path.join(BASE_DIR, "GUI", "config.js")
     
-    try:
-        with open(config_js_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        # Batch mode uses semicolons - check if there's validation
-        if 'includes(";")' in content or 'includes(",")' in content:
-            return GUITestResult("JS Batch Syntax Validation", True)
-        
-        return GUITestResult("JS Batch Syntax Validation", False, "No batch syntax validation found")
-    except Exception as e:
-        return GUITestResult("JS Batch Syntax Validation", False, str(e))
+    # Batch mode uses semicolons - check if there's validation
+    if (_file_contains(config_js_path, 'includes(";")')
+            or _file_contains(config_js_path, 'includes(",")')):
+        return GUITestResult("JS Batch Syntax Validation", True)
+    
+    return GUITestResult("JS Batch Syntax Validation", False, "No batch syntax validation found")
 
 
+@_requires("JS Form Prevent Default", "config.js")
 def test_js_form_prevent_default():
     """Test that form submissions use preventDefault"""
     config_js_path = os.path.join(BASE_DIR, "GUI", "config.js")
     
-    try:
-        with open(config_js_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        # Forms should prevent default submission
-        if 'event.preventDefault()' not in content and 'e.preventDefault()' not in content:
-            return GUITestResult("JS Form Prevent Default", False, "No preventDefault found")
-        
-        return GUITestResult("JS Form Prevent Default", True)
-    except Exception as e:
-        return GUITestResult("JS Form Prevent Default", False, str(e))
+    # Forms should prevent default submission
+    if (not _file_contains(config_js_path, 'event.preventDefault()')
+            and not _file_contains(config_js_path, 'e.preventDefault()')):
+        return GUITestResult("JS Form Prevent Default", False, "No preventDefault found")
+    
+    return GUITestResult("JS Form Prevent Default", True)
 
 
+@_requires("Default Values Set", "settings.html")
 def test_default_values_set():
     """Test that important fields have default values"""
     settings_html_path = os.path.join(BASE_DIR, "GUI", "settings.html")
     
-    try:
-        with open(settings_html_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        # Fields that should have default values
-        defaults_to_check = [
-            ('scenarioName', 'default_scenario'),
-            ('updateInterval', '0.1'),
-            ('endTime', '43200'),
-            ('commonBufferSize', '5M'),
-        ]
-        
-        missing_defaults = []
-        for field_id, expected_value in defaults_to_check:
-            pattern = rf'id="{field_id}"[^>]*value="{expected_value}"'
-            pattern2 = rf'value="{expected_value}"[^>]*id="{field_id}"'
-            if not re.search(pattern, content) and not re.search(pattern2, content):
-                missing_defaults.append(field_id)
-        
-        if missing_defaults:
-            return GUITestResult("Default Values Set", False, f"Missing defaults: {missing_defaults}")
-        return GUITestResult("Default Values Set", True)
-    except Exception as e:
-        return GUITestResult("Default Values Set", False, str(e))
+    attributes = _html_index(settings_html_path).attributes
+    
+    missing_defaults = [field_id for field_id, expected_value in _DEFAULT_VALUES
+                        if attributes.get(field_id, {}).get('value') != expected_value]
+    
+    if missing_defaults:
+        return GUITestResult("Default Values Set", False, f"Missing defaults: {missing_defaults}")
+    return GUITestResult("Default Values Set", True)
 
 
+@_requires("ONE Output Format", "config.js")
 def test_output_format_one_simulator():
     """Test that generated output follows ONE simulator format"""
-    config_js_path = os.path.join(BASE_DIR, "GUI", "config.js")
+    present = _present_in("config.js")
+    missing = [f for f in _ONE_OUTPUT_FORMATS if f not in present]
     
-    try:
-        with open(config_js_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        # ONE simulator format patterns
-        required_formats = [
-            "Scenario.nrofHostGroups =",
-            "Group.nrofInterfaces =",
-            "Group.interface1 =",
-            "MapBasedMovement.nrofMapFiles =",
-            "ProphetRouter.secondsInTimeUnit =",
-            "SprayAndWaitRouter.nrofCopies =",
-            "Optimization.cellSizeMult =",
-        ]
-        
-        missing = [f for f in required_formats if f not in content]
-        
-        if missing:
-            return GUITestResult("ONE Output Format", False, f"Missing: {missing}")
-        return GUITestResult("ONE Output Format", True)
-    except Exception as e:
-        return GUITestResult("ONE Output Format", False, str(e))
+    if missing:
+        return GUITestResult("ONE Output Format", False, f"Missing: {missing}")
+    return GUITestResult("ONE Output Format", True)
 
 
 # ============================================================
 # PHASE 2 TESTS - Energy, POI, Multi-Interface, Import/Export
 # ============================================================
 
-def test_energy_settings_fields():
-    """Test that Energy Model Settings section has all required fields"""
-    settings_html_path = os.path.join(BASE_DIR, "GUI", "settings.html")
-    
-    try:
-        with open(settings_html_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        required_fields = [
-            'id="enableEnergyModel"',
-            'id="energyFields"',
-            'id="initialEnergy"',
-            'id="scanEnergy"',
-            'id="transmitEnergy"',
-            'id="baseEnergy"'
-        ]
-        
-        missing = [field for field in required_fields if field not in content]
-        
-        if missing:
-            return GUITestResult("Energy Settings Fields", False, f"Missing: {missing}")
-        return GUITestResult("Energy Settings Fields", True)
-    except Exception as e:
-        return GUITestResult("Energy Settings Fields", False, str(e))
-
-
-def test_poi_configuration_fields():
-    """Test that POI Configuration section has all required fields"""
-    settings_html_path = os.path.join(BASE_DIR, "GUI", "settings.html")
-    
-    try:
-        with open(settings_html_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        required_fields = [
-            'id="poiEnabled"',
-            'id="poiConfiguration"',
-            'id="poiTableBody"',
-            'id="poiPreview"'
-        ]
-        
-        missing = [field for field in required_fields if field not in content]
-        
-        if missing:
-            return GUITestResult("POI Configuration Fields", False, f"Missing: {missing}")
-        return GUITestResult("POI Configuration Fields", True)
-    except Exception as e:
-        return GUITestResult("POI Configuration Fields", False, str(e))
-
-
+@_requires("Multi-Interface Support", "settings.html", "config.js")
 def test_multi_interface_support():
     """Test that interface field supports multi-selection via Tagify"""
     settings_html_path = os.path.join(BASE_DIR, "GUI", "settings.html")
     config_js_path = os.path.join(BASE_DIR, "GUI", "config.js")
     
-    try:
-        with open(settings_html_path, 'r', encoding='utf-8') as f:
-            html_content = f.read()
-        
-        with open(config_js_path, 'r', encoding='utf-8') as f:
-            js_content = f.read()
-        
-        # Check that commonInterface is an input (not select) for Tagify
-        if 'id="commonInterface"' not in html_content:
-            return GUITestResult("Multi-Interface Support", False, "commonInterface not found")
-        
-        # Check for Tagify initialization function
-        if 'initInterfaceTagify' not in js_content:
-            return GUITestResult("Multi-Interface Support", False, "initInterfaceTagify function not found")
-        
-        # Check for whitelist update function
-        if 'updateInterfaceTagifyWhitelist' not in js_content:
-            return GUITestResult("Multi-Interface Support", False, "updateInterfaceTagifyWhitelist not found")
-        
-        return GUITestResult("Multi-Interface Support", True)
-    except Exception as e:
-        return GUITestResult("Multi-Interface Support", False, str(e))
-
-
-def test_import_config_section():
-    """Test that Import ONE Configuration section exists"""
-    settings_html_path = os.path.join(BASE_DIR, "GUI", "settings.html")
+    # Check that commonInterface is an input (not select) for Tagify
+    if not _file_contains(settings_html_path, 'id="commonInterface"'):
+        return GUITestResult("Multi-Interface Support", False, "commonInterface not found")
     
-    try:
-        with open(settings_html_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        required_fields = [
-            'id="importConfigFile"',
-            'importONEConfig'
-        ]
-        
-        missing = [field for field in required_fields if field not in content]
-        
-        if missing:
-            return GUITestResult("Import Config Section", False, f"Missing: {missing}")
-        return GUITestResult("Import Config Section", True)
-    except Exception as e:
-        return GUITestResult("Import Config Section", False, str(e))
+    # Check for Tagify initialization function
+    if not _file_contains(config_js_path, 'initInterfaceTagify'):
+        return GUITestResult("Multi-Interface Support", False, "initInterfaceTagify function not found")
+    
+    # Check for whitelist update function
+    if not _file_contains(config_js_path, 'updateInterfaceTagifyWhitelist'):
+        return GUITestResult("Multi-Interface Support", False, "updateInterfaceTagifyWhitelist not found")
+    
+    return GUITestResult("Multi-Interface Support", True)
 
 
+@_requires("Import/Export Functions", "config.js")
 def test_import_export_functions():
     """Test that import/export functions exist in config.js"""
-    config_js_path = os.path.join(BASE_DIR, "GUI", "config.js")
+    present = _present_in("config.js")
+    missing = [fn for fn in _IMPORT_EXPORT_FUNCTIONS if f"function {fn}" not in present]
     
-    try:
-        with open(config_js_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        required_functions = [
-            'importONEConfig',
-            'parseONEConfig',
-            'applyConfigToForm'
-        ]
-        
-        missing = []
-        for fn in required_functions:
-            if f"function {fn}" not in content:
-                missing.append(fn)
-        
-        if missing:
-            return GUITestResult("Import/Export Functions", False, f"Missing: {missing}")
-        return GUITestResult("Import/Export Functions", True)
-    except Exception as e:
-        return GUITestResult("Import/Export Functions", False, str(e))
+    if missing:
+        return GUITestResult("Import/Export Functions", False, f"Missing: {missing}")
+    return GUITestResult("Import/Export Functions", True)
 
 
+@_requires("POI Functions", "config.js")
 def test_poi_functions():
     """Test that POI management functions exist in config.js"""
-    config_js_path = os.path.join(BASE_DIR, "GUI", "config.js")
-    
-    try:
-        with open(config_js_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        required_functions = [
-            'addPOIRow',
-            'removePOIRow',
-            'updatePOIPreview'
-        ]
-        
-        missing = []
-        for fn in required_functions:
-            if f"function {fn}" not in content:
-                missing.append(fn)
-        
-        if missing:
-            return GUITestResult("POI Functions", False, f"Missing: {missing}")
-        return GUITestResult("POI Functions", True)
-    except Exception as e:
-        return GUITestResult("POI Functions", False, str(e))
-
-
-def test_energy_export_format():
-    """Test that energy settings are exported in correct ONE format"""
-    config_js_path = os.path.join(BASE_DIR, "GUI", "config.js")
+    present = _present_in("config.js")
+    missing = [fn for fn in _POI_FUNCTIONS if f"function {fn}" not in present]
     
-    try:
-        with open(config_js_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        required_patterns = [
-            'Group.initialEnergy =',
-            'Group.scanEnergy =',
-            'Group.transmitEnergy =',
-            'Group.baseEnergy ='
-        ]
-        
-        missing = [p for p in required_patterns if p not in content]
-        
-        if missing:
-            return GUITestResult("Energy Export Format", False, f"Missing: {missing}")
-        return GUITestResult("Energy Export Format", True)
-    except Exception as e:
-        return GUITestResult("Energy Export Format", False, str(e))
+    if missing:
+        return GUITestResult("POI Functions", False, f"Missing: {missing}")
+    return GUITestResult("POI Functions", True)
 
 
+@_requires("POI Export Format", "config.js")
 def test_poi_export_format():
     """Test that POI settings are exported in correct ONE format"""
     config_js_path = os.path.join(BASE_DIR, "GUI", "config.js")
     
-    try:
-        with open(config_js_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        if 'Group.pois =' not in content:
-            return GUITestResult("POI Export Format", False, "Group.pois = not found")
-        
-        return GUITestResult("POI Export Format", True)
-    except Exception as e:
-        return GUITestResult("POI Export Format", False, str(e))
+    if not _file_contains(config_js_path, 'Group.pois ='):
+        return GUITestResult("POI Export Format", False, "Group.pois = not found")
+    
+    return GUITestResult("POI Export Format", True)
 
 
+@_requires("CSS Form Hint Class", "settings.css")
 def test_css_form_hint_class():
     """Test that form-hint CSS class exists"""
     css_path = os.path.join(BASE_DIR, "GUI", "settings.css")
     
-    try:
-        with open(css_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        if '.form-hint' not in content:
-            return GUITestResult("CSS Form Hint Class", False, ".form-hint class not found")
-        
-        return GUITestResult("CSS Form Hint Class", True)
-    except Exception as e:
-        return GUITestResult("CSS Form Hint Class", False, str(e))
-
-
-def test_tooltip_css_exists():
-    """Test that data-tooltip CSS styling exists"""
-    css_path = os.path.join(BASE_DIR, "GUI", "settings.css")
+    if not _file_contains(css_path, '.form-hint'):
+        return GUITestResult("CSS Form Hint Class", False, ".form-hint class not found")
     
-    try:
-        with open(css_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        required = [
-            'data-tooltip',
-            '::before',
-            '::after'
-        ]
-        
-        missing = [r for r in required if r not in content]
-        
-        if missing:
-            return GUITestResult("Tooltip CSS", False, f"Missing: {missing}")
-        return GUITestResult("Tooltip CSS", True)
-    except Exception as e:
-        return GUITestResult("Tooltip CSS", False, str(e))
+    return GUITestResult("CSS Form Hint Class", True)
 
 
-def test_tooltips_on_scenario_settings():
-    """Test that Scenario Settings fields have tooltips"""
-    settings_html_path = os.path.join(BASE_DIR, "GUI", "settings.html")
-    
-    try:
-        with open(settings_html_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        fields_with_tooltips = [
-            'for="scenarioName"',
-            'for="updateInterval"',
-            'for="endTime"',
-            'for="simulateConnections"'
-        ]
+def _tooltip_test(name, section, fields):
+    """Build a test checking that each field's label in a section has a tooltip"""
+    @_requires(name, "settings.html")
+    def test():
+        settings_html_path = os.path.join(BASE_DIR, "GUI", "settings.html")
         
-        missing_tooltips = []
-        for field in fields_with_tooltips:
-            # Check if the label has data-tooltip
-            pattern = f'{field}[^>]*data-tooltip='
-            if not re.search(pattern, content):
-                missing_tooltips.append(field)
+        missing_tooltips = _missing_tooltips(settings_html_path, fields)
         
         if missing_tooltips:
-            return GUITestResult("Scenario Settings Tooltips", False, f"Missing tooltips: {missing_tooltips}")
-        return GUITestResult("Scenario Settings Tooltips", True)
-    except Exception as e:
-        return GUITestResult("Scenario Settings Tooltips", False, str(e))
-
-
-def test_tooltips_on_group_settings():
-    """Test that Group Settings fields have tooltips"""
-    settings_html_path = os.path.join(BASE_DIR, "GUI", "settings.html")
+            return GUITestResult(name, False, f"Missing tooltips: {missing_tooltips}")
+        return GUITestResult(name, True)
     
-    try:
-        with open(settings_html_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        fields_with_tooltips = [
-            'for="commonMovementModel"',
-            'for="commonRouter"',
-            'for="commonBufferSize"',
-            'for="commonInterface"'
-        ]
-        
-        missing_tooltips = []
-        for field in fields_with_tooltips:
-            pattern = f'{field}[^>]*data-tooltip='
-            if not re.search(pattern, content):
-                missing_tooltips.append(field)
-        
-        if missing_tooltips:
-            return GUITestResult("Group Settings Tooltips", False, f"Missing tooltips: {missing_tooltips}")
-        return GUITestResult("Group Settings Tooltips", True)
-    except Exception as e:
-        return GUITestResult("Group Settings Tooltips", False, str(e))
+    test.__doc__ = f"Test that {section} fields have tooltips"
+    return test
 
 
-def test_tooltips_on_energy_settings():
-    """Test that Energy Settings fields have tooltips"""
-    settings_html_path = os.path.join(BASE_DIR, "GUI", "settings.html")
-    
-    try:
-        with open(settings_html_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        fields_with_tooltips = [
-            'for="enableEnergyModel"',
-            'for="initialEnergy"',
-            'for="scanEnergy"'
-        ]
-        
-        missing_tooltips = []
-        for field in fields_with_tooltips:
-            pattern = f'{field}[^>]*data-tooltip='
-            if not re.search(pattern, content):
-                missing_tooltips.append(field)
-        
-        if missing_tooltips:
-            return GUITestResult("Energy Settings Tooltips", False, f"Missing tooltips: {missing_tooltips}")
-        return GUITestResult("Energy Settings Tooltips", True)
-    except Exception as e:
-        return GUITestResult("Energy Settings Tooltips", False, str(e))
+test_tooltips_on_scenario_settings = _tooltip_test(
+    "Scenario Settings Tooltips", "Scenario Settings", _SCENARIO_TOOLTIPS)
+test_tooltips_on_group_settings = _tooltip_test(
+    "Group Settings Tooltips", "Group Settings", _GROUP_TOOLTIPS)
+test_tooltips_on_energy_settings = _tooltip_test(
+    "Energy Settings Tooltips", "Energy Settings", _ENERGY_TOOLTIPS)
 
 
 # ============================================================
 # TEST RUNNER
 # ============================================================
 
-def run_gui_tests():
-    """Run all GUI tests"""
-    results = []
-    
-    print("\n" + "="*60)
-    print("GUI TESTS")
-    print("="*60)
-    
-    # HTML Structure Tests
-    print("\n--- HTML Structure Tests ---")
-    html_tests = [
+# (section heading, tests) in report order; strings name _SUITE entries
+_GUI_TEST_SECTIONS = (
+    ("HTML Structure Tests", (
         test_html_tabs_exist,
-        test_scenario_settings_fields,
-        test_interface_settings_fields,
-        test_group_settings_fields,
-        test_event_settings_fields,
-        test_report_settings_fields,
-        test_movement_settings_fields,
-        test_post_processing_fields,
-    ]
-    
-    for test_func in html_tests:
-        result = test_func()
-        results.append(result)
-        print(result)
-    
-    # Dropdown/Selection Tests
-    print("\n--- Dropdown/Selection Tests ---")
-    dropdown_tests = [
-        test_router_whitelist,
-        test_router_dropdown_options,
-        test_movement_models_dropdown,
-        test_report_classes_dropdown,
-    ]
-    
-    for test_func in dropdown_tests:
-        result = test_func()
-        results.append(result)
-        print(result)
-    
-    # JavaScript Tests
-    print("\n--- JavaScript Tests ---")
-    js_tests = [
+        "Scenario Settings Fields",
+        "Interface Settings Fields",
+        "Group Settings Fields",
+        "Event Settings Fields",
+        "Report Settings Fields",
+        "Movement Settings Fields",
+        "Post-Processing Fields",
+    )),
+    ("Dropdown/Selection Tests", (
+        "Router Whitelist",
+        "Router Dropdown Options",
+        "Movement Models Dropdown",
+        "Report Classes Dropdown",
+    )),
+    ("JavaScript Tests", (
         test_config_js_functions,
-        test_config_js_event_handlers,
-        test_config_js_api_calls,
-        test_config_js_default_interfaces,
+        "Config.js Event Handlers",
+        "Config.js API Calls",
+        "Default Interfaces",
         test_config_js_default_groups,
         test_settings_export_format,
-    ]
-    
-    for test_func in js_tests:
-        result = test_func()
-        results.append(result)
-        print(result)
-    
-    # CSS Tests
-    print("\n--- CSS Tests ---")
-    css_tests = [
+    )),
+    ("CSS Tests", (
         test_css_file_valid,
-        test_css_button_classes,
-    ]
-    
-    for test_func in css_tests:
-        result = test_func()
-        results.append(result)
-        print(result)
-    
-    # Input Validation Tests
-    print("\n--- Input Validation Tests ---")
-    validation_tests = [
+        "CSS Button Classes",
+    )),
+    ("Input Validation Tests", (
         test_required_fields_have_required_attribute,
         test_number_inputs_have_constraints,
         test_input_types_correct,
@@ -1209,51 +934,54 @@ def run_gui_tests():
         test_js_form_prevent_default,
         test_default_values_set,
         test_output_format_one_simulator,
-    ]
-    
-    for test_func in validation_tests:
-        result = test_func()
-        results.append(result)
-        print(result)
-    
-    # Phase 2 Tests - Energy, POI, Multi-Interface, Import/Export
-    print("\n--- Phase 2 Tests (Energy, POI, Multi-Interface) ---")
-    phase2_tests = [
-        test_energy_settings_fields,
-        test_poi_configuration_fields,
+    )),
+    ("Phase 2 Tests (Energy, POI, Multi-Interface)", (
+        "Energy Settings Fields",
+        "POI Configuration Fields",
         test_multi_interface_support,
-        test_import_config_section,
+        "Import Config Section",
         test_import_export_functions,
         test_poi_functions,
-        test_energy_export_format,
+        "Energy Export Format",
         test_poi_export_format,
         test_css_form_hint_class,
-    ]
-    
-    for test_func in phase2_tests:
-        result = test_func()
-        results.append(result)
-        print(result)
-    
-    # Phase 3 Tests - Tooltips/Usability
-    print("\n--- Phase 3 Tests (Tooltips/Usability) ---")
-    phase3_tests = [
-        test_tooltip_css_exists,
+    )),
+    ("Phase 3 Tests (Tooltips/Usability)", (
+        "Tooltip CSS",
         test_tooltips_on_scenario_settings,
         test_tooltips_on_group_settings,
         test_tooltips_on_energy_settings,
-    ]
-    
-    for test_func in phase3_tests:
-        result = test_func()
-        results.append(result)
-        print(result)
+    )),
+)
+
+
+def run_gui_tests():
+    """Run all GUI tests"""
+    # Table-driven substring tests run up front, one scan per file; the
+    # section table refers to them by result name
+    suite = _run_substr_tests()
+    
+    def run(test):
+        return suite[test] if isinstance(test, str) else test()
+    
+    # Tests are independent file reads; one pool runs them all and map()
+    # keeps results in declaration order
+    all_tests = [test for _, tests in _GUI_TEST_SECTIONS for test in tests]
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        results = list(executor.map(run, all_tests))
+    
+    # Build the report and emit it with a single write
+    out = ["", "="*60, "GUI TESTS", "="*60]
+    remaining = iter(results)
+    for title, tests in _GUI_TEST_SECTIONS:
+        out += ["", f"--- {title} ---"]
+        out += [str(next(remaining)) for _ in tests]
     
     # Summary
     passed = sum(1 for r in results if r.passed)
     total = len(results)
-    print(f"\nGUI Tests: {passed}/{total} passed")
-    print("="*60)
+    out += ["", f"GUI Tests: {passed}/{total} passed", "="*60]
+    sys.stdout.write("\n".join(out) + "\n")
     
     return results
 
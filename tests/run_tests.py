@@ -52,8 +52,8 @@ def run_all_tests():
 def print_summary(results):
     """Print test summary"""
     passed = sum(1 for r in results if r.passed)
-    failed = sum(1 for r in results if not r.passed)
     total = len(results)
+    failed = total - passed
     
     print("\n" + "="*60)
     print("TEST SUMMARY")
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Averager Parsing Tests for OppNDA
+Table-driven checks that the regex report parser and the output template
+renderer match the line-by-line semantics they replaced.
+"""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.averager import read_and_parse_file_parallel, render_template
+
+
+def _line_split_parse(raw, separator, ignore_fields):
+    """Reference parser: the original per-line strip/split/float loop"""
+    data = {}
+    for line in raw.decode().splitlines():
+        line = line.strip()
+        if not line or separator not in line:
+            continue
+        field, value = line.split(separator, 1)
+        field = field.strip()
+        value = value.strip()
+        if field in ignore_fields:
+            continue
+        try:
+            data[field] = float(value) if value.lower() != 'nan' else np.nan
+        except ValueError:
+            continue
+    return data
+
+
+def _replace_each(template, subs):
+    """Reference renderer: the original one str.replace per substitution"""
+    for field, value in subs.items():
+        template = template.replace(f'{{{field}}}', str(value))
+    return template
+
+
+# (id, file bytes, separator, ignore_fields, expected fields -> values in order)
+PARSE_CASES = [
+    ("simple", b"sim_time: 100\ndelivery_prob: 0.5\n", ':', (),
+     {'sim_time': 100.0, 'delivery_prob': 0.5}),
+    ("blank-padded", b"  latency_avg \t:\t 12.5  \n\n", ':', (),
+     {'latency_avg': 12.5}),
+    ("field-with-blanks", b"delivery prob: 0.25\n", ':', (),
+     {'delivery prob': 0.25}),
+    ("split-at-first-sep", b"a:b: 3\nc: 4\n", ':', (),
+     {'c': 4.0}),
+    ("value-with-blank", b"a: 1 2\nb: 3\n", ':', (),
+     {'b': 3.0}),
+    ("no-separator", b"Message stats for scenario x\na: 1\n", ':', (),
+     {'a': 1.0}),
+    ("multi-char-sep", b"a :: 1\nb::2\nc: 3\nd:e :: 4\n", '::', (),
+     {'a': 1.0, 'b': 2.0, 'd:e': 4.0}),
+    ("equals-sep", b"a = 1\nb: 2\n", '=', (),
+     {'a': 1.0}),
+    ("crlf", b"a: 1\r\nb: 2\r\n", ':', (),
+     {'a': 1.0, 'b': 2.0}),
+    ("nan-inf", b"a: nan\nb: NaN\nc: inf\nd: -1e3\n", ':', (),
+     {'a': np.nan, 'b': np.nan, 'c': np.inf, 'd': -1000.0}),
+    ("non-numeric", b"a: NA\nb: 1\nc: x\n", ':', (),
+     {'b': 1.0}),
+    ("duplicate-last-numeric", b"a: 1\na: x\nb: 2\na: 3\n", ':', (),
+     {'a': 3.0, 'b': 2.0}),
+    ("duplicate-non-numeric-last", b"a: 1\na: x\n", ':', (),
+     {'a': 1.0}),
+    ("duplicate-order", b"a: x\nb: 1\na: 2\n", ':', (),
+     {'b': 1.0, 'a': 2.0}),
+    ("ignore-fields", b"sim_time: 5\na: 1\nhops: 2\n", ':', ('sim_time', 'hops'),
+     {'a': 1.0}),
+    ("empty", b"", ':', (),
+     {}),
+    ("blank-lines-only", b"\n\n  \n", ':', (),
+     {}),
+]
+
+
+@pytest.mark.parametrize("raw,separator,ignore_fields,expected",
+                         [case[1:] for case in PARSE_CASES],
+                         ids=[case[0] for case in PARSE_CASES])
+def test_read_and_parse_file(tmp_path, raw, separator, ignore_fields, expected):
+    """Test each report parses to the expected fields, in the reference order"""
+    path = tmp_path / 'report.txt'
+    path.write_bytes(raw)
+
+    report = read_and_parse_file_parallel((str(path), separator, frozenset(ignore_fields)))
+    reference = _line_split_parse(raw, separator, ignore_fields)
+
+    assert report.filepath == str(path)
+    assert report.fields == tuple(expected) == tuple(reference)
+    np.testing.assert_array_equal(report.values, list(expected.values()))
+    np.testing.assert_array_equal(report.values, list(reference.values()))
+
+
+def test_read_and_parse_missing_file(tmp_path):
+    """Test an unreadable report yields no values instead of raising"""
+    report = read_and_parse_file_parallel((str(tmp_path / 'missing.txt'), ':', frozenset()))
+    assert report.values is None
+
+
+# (id, template, substitutions, expected output)
+TEMPLATE_CASES = [
+    ("fields", "{router}_{ttl}.txt", {'router': 'Epidemic', 'ttl': 60}, "Epidemic_60.txt"),
+    ("repeated", "{a}-{a}", {'a': 1}, "1-1"),
+    ("unknown-kept", "{a}_{missing}", {'a': 1}, "1_{missing}"),
+    ("no-placeholders", "report.txt", {'a': 1}, "report.txt"),
+    ("lone-brace", "a{b", {'b': 2}, "a{b"),
+    ("doubled-braces", "{{a}}", {'a': 1}, "{1}"),
+    ("empty-name", "{}", {'a': 1}, "{}"),
+    ("empty-template", "", {'a': 1}, ""),
+]
+
+
+@pytest.mark.parametrize("template,subs,expected",
+                         [case[1:] for case in TEMPLATE_CASES],
+                         ids=[case[0] for case in TEMPLATE_CASES])
+def test_render_template(template, subs, expected):
+    """Test one-pass rendering matches repeated str.replace"""
+    assert render_template(template, subs) == expected == _replace_each(template, subs)
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-q"]))
@@ -6,14 +6,17 @@ Captures baseline behavior and verifies functionality after refactoring.
 
 import os
 import sys
-import json
-import hashlib
-import importlib.util
+from functools import lru_cache
 
-# Add parent directory to path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# ast, hashlib, json and concurrent.futures are imported inside the helpers
+# that use them, so collecting only a subset of these tests stays cheap
 
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Add parent directory to path
+if BASE_DIR not in sys.path:
+    sys.path.insert(0, BASE_DIR)
+
 SNAPSHOT_DIR = os.path.join(BASE_DIR, "tests", "snapshots")
 
 
@@ -22,44 +25,62 @@ def _ensure_snapshot_dir():
     os.makedirs(SNAPSHOT_DIR, exist_ok=True)
 
 
+# Directories whose files the tests and snapshots reference
+_CHECKED_DIRS = ("app", "core", "config", "GUI")
+
+
+@lru_cache(maxsize=None)
+def _existing_files():
+    """Relative paths of all files in _CHECKED_DIRS, from one scandir per dir"""
+    existing = set()
+    for directory in _CHECKED_DIRS:
+        try:
+            with os.scandir(os.path.join(BASE_DIR, directory)) as entries:
+                existing.update(f"{directory}/{e.name}" for e in entries if e.is_file())
+        except FileNotFoundError:
+            continue
+    return frozenset(existing)
+
+
+def _syntax_ok(path):
+    """Parse a module's source without importing it; raises SyntaxError"""
+    import ast
+    # Bytes let the parser honour PEP 263 coding cookies and skip a str decode
+    with open(path, 'rb') as f:
+        ast.parse(f.read(), filename=path)
+    return True
+
+
 # ============================================================================
 # PYTEST-COMPATIBLE TESTS (use assertions, don't return values)
 # ============================================================================
 
 def test_flask_app_imports():
-    """Test that Flask app package can be imported without errors"""
+    """Test that Flask app package source parses without syntax errors"""
     app_init = os.path.join(BASE_DIR, "app", "__init__.py")
-    assert os.path.exists(app_init), "app/__init__.py not found"
-    spec = importlib.util.spec_from_file_location("app", app_init)
-    module = importlib.util.module_from_spec(spec)
-    assert module is not None
+    assert "app/__init__.py" in _existing_files(), "app/__init__.py not found"
+    assert _syntax_ok(app_init)
 
 
 def test_analysis_imports():
-    """Test that analysis.py can be imported"""
+    """Test that analysis.py has valid syntax"""
     core_path = os.path.join(BASE_DIR, "core", "analysis.py")
-    assert os.path.exists(core_path), "core/analysis.py not found"
-    spec = importlib.util.spec_from_file_location("analysis", core_path)
-    module = importlib.util.module_from_spec(spec)
-    assert module is not None
+    assert "core/analysis.py" in _existing_files(), "core/analysis.py not found"
+    assert _syntax_ok(core_path)
 
 
 def test_averager_imports():
-    """Test that averager.py can be imported"""
+    """Test that averager.py has valid syntax"""
     core_path = os.path.join(BASE_DIR, "core", "averager.py")
-    assert os.path.exists(core_path), "core/averager.py not found"
-    spec = importlib.util.spec_from_file_location("averager", core_path)
-    module = importlib.util.module_from_spec(spec)
-    assert module is not None
+    assert "core/averager.py" in _existing_files(), "core/averager.py not found"
+    assert _syntax_ok(core_path)
 
 
 def test_regression_imports():
-    """Test that regression.py can be imported"""
+    """Test that regression.py has valid syntax"""
     core_path = os.path.join(BASE_DIR, "core", "regression.py")
-    assert os.path.exists(core_path), "core/regression.py not found"
-    spec = importlib.util.spec_from_file_location("regression", core_path)
-    module = importlib.util.module_from_spec(spec)
-    assert module is not None
+    assert "core/regression.py" in _existing_files(), "core/regression.py not found"
+    assert _syntax_ok(core_path)
 
 
 def test_gui_files_exist():
@@ -70,15 +91,15 @@ def test_gui_files_exist():
         "GUI/config.js",
     ]
     
+    existing = _existing_files()
     for file in gui_files:
-        filepath = os.path.join(BASE_DIR, file)
-        assert os.path.exists(filepath), f"Missing: {file}"
+        assert file in existing, f"Missing: {file}"
 
 
 def test_gui_html_valid():
     """Basic validation that HTML files have required elements"""
     html_path = os.path.join(BASE_DIR, "GUI", "settings.html")
-    assert os.path.exists(html_path), "settings.html not found"
+    assert "GUI/settings.html" in _existing_files(), "settings.html not found"
     
     with open(html_path, 'r', encoding='utf-8') as f:
         content = f.read()
@@ -92,39 +113,138 @@ def test_gui_html_valid():
 # SNAPSHOT UTILITIES (for standalone runner)
 # ============================================================================
 
-def _create_file_snapshot(filepath, snapshot_name):
-    """Create a hash snapshot of a file for comparison"""
-    _ensure_snapshot_dir()
-    with open(filepath, 'rb') as f:
-        content = f.read()
-    file_hash = hashlib.sha256(content).hexdigest()
+def _new_hasher(algorithm):
+    """Return a fresh hash object; raises ImportError if its package is missing"""
+    if algorithm == "blake3":
+        from blake3 import blake3
+        return blake3()
+    if algorithm == "xxh3_128":
+        import xxhash
+        return xxhash.xxh3_128()
+    import hashlib
+    return hashlib.new(algorithm)
+
+
+@lru_cache(maxsize=None)
+def _snapshot_algorithm():
+    """Fastest installed hash for new snapshots: blake3, xxh3_128, else sha256.
     
-    snapshot_path = os.path.join(SNAPSHOT_DIR, f"{snapshot_name}.json")
-    snapshot_data = {
+    Snapshots only detect changes, so a non-cryptographic hash is sufficient.
+    """
+    for algorithm in ("blake3", "xxh3_128"):
+        try:
+            _new_hasher(algorithm)
+        except ImportError:
+            continue
+        return algorithm
+    return "sha256"
+
+
+def _hash_file(filepath, algorithm="sha256"):
+    """Stream a file through a hash without loading it whole; returns (hash, size)"""
+    import hashlib
+    with open(filepath, 'rb') as f:
+        if hasattr(hashlib, 'file_digest'):  # Python 3.11+
+            digest = hashlib.file_digest(f, lambda: _new_hasher(algorithm))
+        else:
+            digest = _new_hasher(algorithm)
+            for chunk in iter(lambda: f.read(1 << 16), b''):
+                digest.update(chunk)
+        size = f.tell()
+    return digest.hexdigest(), size
+
+
+@lru_cache(maxsize=None)
+def _orjson():
+    """Return the orjson module if installed, else None"""
+    try:
+        import orjson
+    except ImportError:
+        return None
+    return orjson
+
+
+def _dump_snapshot(data):
+    """Serialize snapshot data to compact JSON bytes"""
+    # Snapshots are machine-read: use orjson when installed, compact json otherwise
+    orjson = _orjson()
+    if orjson is not None:
+        return orjson.dumps(data)
+    import json
+    return json.dumps(data, separators=(',', ':')).encode('utf-8')
+
+
+def _load_snapshot(raw):
+    """Parse snapshot JSON bytes (compact or legacy indented)"""
+    orjson = _orjson()
+    if orjson is not None:
+        return orjson.loads(raw)
+    import json
+    return json.loads(raw)
+
+
+# All snapshots live in one file, keyed by snapshot name
+SNAPSHOT_INDEX = "snapshots.json"
+
+
+def _file_snapshot(filepath):
+    """Build the hash snapshot entry of a file for comparison"""
+    algorithm = _snapshot_algorithm()
+    file_hash, size = _hash_file(filepath, algorithm)
+    return {
         "file": filepath,
         "hash": file_hash,
-        "size": len(content)
+        "algorithm": algorithm,
+        "size": size
     }
-    
-    with open(snapshot_path, 'w') as f:
-        json.dump(snapshot_data, f, indent=2)
-    
-    return True
+
+
+@lru_cache(maxsize=None)
+def _read_snapshot_index(index_path, mtime_ns):
+    """Parse the snapshot index once per modification (mtime_ns keys the cache)"""
+    with open(index_path, 'rb') as f:
+        return _load_snapshot(f.read())
+
+
+def _load_snapshot_index():
+    """Return {snapshot_name: entry} from the index, or {} if none exists"""
+    index_path = os.path.join(SNAPSHOT_DIR, SNAPSHOT_INDEX)
+    try:
+        mtime_ns = os.stat(index_path).st_mtime_ns
+    except FileNotFoundError:
+        return {}
+    return _read_snapshot_index(index_path, mtime_ns)
+
+
+def _write_snapshot_index(snapshots):
+    """Write every snapshot entry to the index in a single write"""
+    _ensure_snapshot_dir()
+    with open(os.path.join(SNAPSHOT_DIR, SNAPSHOT_INDEX), 'wb') as f:
+        f.write(_dump_snapshot(snapshots))
 
 
 def _compare_with_snapshot(filepath, snapshot_name):
     """Compare current file with saved snapshot"""
-    snapshot_path = os.path.join(SNAPSHOT_DIR, f"{snapshot_name}.json")
+    snapshot = _load_snapshot_index().get(snapshot_name)
     
-    if not os.path.exists(snapshot_path):
-        return False, "No baseline snapshot exists"
+    if snapshot is None:
+        # Fall back to a legacy per-file snapshot
+        snapshot_path = os.path.join(SNAPSHOT_DIR, f"{snapshot_name}.json")
+        if not os.path.exists(snapshot_path):
+            return False, "No baseline snapshot exists"
+        with open(snapshot_path, 'rb') as f:
+            snapshot = _load_snapshot(f.read())
     
-    with open(snapshot_path, 'r') as f:
-        snapshot = json.load(f)
+    # A size mismatch already proves a change; skip reading the file
+    if os.path.getsize(filepath) != snapshot.get("size"):
+        return False, "File size changed"
     
-    with open(filepath, 'rb') as f:
-        content = f.read()
-    current_hash = hashlib.sha256(content).hexdigest()
+    # Snapshots written before the algorithm was recorded used SHA-256
+    algorithm = snapshot.get("algorithm", "sha256")
+    try:
+        current_hash, _ = _hash_file(filepath, algorithm)
+    except ImportError:
+        return False, f"Hash algorithm {algorithm} not available"
     
     if current_hash == snapshot["hash"]:
         return True, "File unchanged"
@@ -136,11 +256,19 @@ def _compare_with_snapshot(filepath, snapshot_name):
 # STANDALONE RUNNER (for direct execution)
 # ============================================================================
 
+def _run_test(test_func):
+    """Call a pytest-style test; return the raised exception or None"""
+    try:
+        test_func()
+    except Exception as e:
+        return e
+    return None
+
+
 def run_framework_tests():
     """Run all framework tests (standalone mode)"""
-    print("\n" + "="*60)
-    print("FRAMEWORK TESTS")
-    print("="*60)
+    # Collect report lines and emit them with a single write
+    out = ["", "="*60, "FRAMEWORK TESTS", "="*60]
     
     tests = [
         ("Flask App Syntax", test_flask_app_imports),
@@ -154,25 +282,26 @@ def run_framework_tests():
     passed = 0
     total = len(tests)
     
-    for name, test_func in tests:
-        try:
-            test_func()
-            print(f"[PASS]: {name}")
+    from concurrent.futures import ThreadPoolExecutor
+    
+    # Tests only read files, so run them concurrently; map() preserves order
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        errors = list(executor.map(_run_test, [func for _, func in tests]))
+    
+    for (name, _), error in zip(tests, errors):
+        if error is None:
+            out.append(f"[PASS]: {name}")
             passed += 1
-        except AssertionError as e:
-            print(f"[FAIL]: {name} - {e}")
-        except Exception as e:
-            print(f"[FAIL]: {name} - {e}")
+        else:
+            out.append(f"[FAIL]: {name} - {error}")
     
-    print(f"\nFramework Tests: {passed}/{total} passed")
-    print("="*60)
+    out += ["", f"Framework Tests: {passed}/{total} passed", "="*60]
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 def create_baseline_snapshots():
     """Create baseline snapshots for all key files"""
-    print("\n" + "="*60)
-    print("CREATING BASELINE SNAPSHOTS")
-    print("="*60)
+    out = ["", "="*60, "CREATING BASELINE SNAPSHOTS", "="*60]
     
     files_to_snapshot = [
         ("app/__init__.py", "app_init"),
@@ -187,13 +316,19 @@ def create_baseline_snapshots():
         ("GUI/config.js", "config_js"),
     ]
     
+    # Keep entries for files that are skipped this time
+    snapshots = dict(_load_snapshot_index())
+    existing = _existing_files()
     for filename, snapshot_name in files_to_snapshot:
         filepath = os.path.join(BASE_DIR, filename)
-        if os.path.exists(filepath):
-            _create_file_snapshot(filepath, snapshot_name)
-            print(f"[CREATED]: {snapshot_name}")
+        if filename in existing:
+            snapshots[snapshot_name] = _file_snapshot(filepath)
+            out.append(f"[CREATED]: {snapshot_name}")
         else:
-            print(f"[SKIP]: {filename} (file not found)")
+            out.append(f"[SKIP]: {filename} (file not found)")
+    
+    _write_snapshot_index(snapshots)
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 if __name__ == "__main__":
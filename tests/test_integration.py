@@ -6,15 +6,24 @@ Tests the complete flow: settings modification -> save -> run simulation -> post
 
 import os
 import sys
+import re
 import json
 import shutil
 import tempfile
 import platform
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
 from unittest import mock
 
 import pytest
 
+# orjson parses noticeably faster when installed; stdlib json otherwise
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
@@ -23,15 +32,88 @@ CONFIG_DIR = BASE_DIR / 'config'
 FIXTURES_DIR = Path(__file__).resolve().parent / 'fixtures'
 
 
+def _read_json(path):
+    """Parse a JSON file, via orjson when available"""
+    if orjson is not None:
+        return orjson.loads(Path(path).read_bytes())
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+@lru_cache(maxsize=None)
+def _load_config(name):
+    """Parse config/<name>_config.json once per process"""
+    return _read_json(CONFIG_DIR / f'{name}_config.json')
+
+
+# (client, app) from the first get_test_client() call; (None, None) if the
+# app failed to import, so later calls don't retry the import
+_TEST_CLIENT_CACHE = None
+
+
 def get_test_client():
-    """Create Flask test client"""
-    try:
-        from app import create_app
-        app = create_app()
-        app.config['TESTING'] = True
-        return app.test_client(), app
-    except ImportError:
-        return None, None
+    """Return the Flask test client, creating the app once per process"""
+    global _TEST_CLIENT_CACHE
+    if _TEST_CLIENT_CACHE is None:
+        try:
+            from app import create_app
+            app = create_app()
+            app.config['TESTING'] = True
+            _TEST_CLIENT_CACHE = (app.test_client(), app)
+        except ImportError:
+            _TEST_CLIENT_CACHE = (None, None)
+    return _TEST_CLIENT_CACHE
+
+
+@pytest.fixture(scope="session")
+def client():
+    """Session-wide Flask test client; skips the test if the app is unavailable"""
+    test_client, _ = get_test_client()
+    if test_client is None:
+        pytest.skip("Flask app not available")
+    return test_client
+
+
+@pytest.fixture(scope="session")
+def configs():
+    """Parsed analysis/averager/regression configs, shared read-only"""
+    return {name: _load_config(name) for name in ('analysis', 'averager', 'regression')}
+
+
+# Post-processing script file -> name recorded by script_recorder
+_SCRIPT_NAMES = {
+    'averager.py': 'averager',
+    'analysis.py': 'analysis',
+    'regression.py': 'regression',
+}
+
+
+@pytest.fixture
+def script_recorder():
+    """Patch subprocess.run to succeed and record which scripts were run, in order"""
+    calls = []
+    
+    def _run(args, **kwargs):
+        if isinstance(args, list) and len(args) > 1:
+            name = _SCRIPT_NAMES.get(Path(str(args[1])).name)
+            if name:
+                calls.append(name)
+        return mock.Mock(returncode=0, stdout='OK', stderr='')
+    
+    with mock.patch('subprocess.run', side_effect=_run):
+        yield calls
+
+
+@pytest.fixture
+def project_dir(tmp_path, monkeypatch):
+    """Point the app's BASE_DIR at tmp_path, with a copy of config/ inside it"""
+    _, app = get_test_client()
+    if app is None:
+        pytest.skip("Flask app not available")
+    shutil.copytree(CONFIG_DIR, tmp_path / 'config')
+    monkeypatch.setitem(app.config, 'BASE_DIR', tmp_path)
+    monkeypatch.setitem(app.config, 'CONFIG_DIR', tmp_path / 'config')
+    return tmp_path
 
 
 # ============================================================================
@@ -41,62 +123,46 @@ def get_test_client():
 class TestSettingsSaveFlow:
     """Tests for settings modification and saving."""
     
-    def test_save_settings_creates_file(self):
+    def test_save_settings_creates_file(self, client, project_dir):
         """Verify settings are saved to .txt file in project root."""
-        client, app = get_test_client()
-        if client is None:
-            pytest.skip("Flask app not available")
-        
-        test_filename = 'integration_test_settings_DELETE_ME.txt'
+        test_filename = 'integration_test_settings.txt'
         test_content = "# Integration Test\nScenario.name = test_integration\n"
         
-        try:
-            response = client.post(
-                '/api/save-settings',
-                data=json.dumps({
-                    'filename': test_filename,
-                    'content': test_content
-                }),
-                content_type='application/json'
-            )
-            
-            assert response.status_code == 200
-            data = json.loads(response.data)
-            assert data.get('success') is True
-            
-            # Verify file was created
-            settings_path = BASE_DIR / test_filename
-            assert settings_path.exists()
-            
-            with open(settings_path, 'r', encoding='utf-8') as f:
-                saved_content = f.read()
-            assert saved_content == test_content
-            
-        finally:
-            # Cleanup
-            test_file = BASE_DIR / test_filename
-            if test_file.exists():
-                test_file.unlink()
+        response = client.post(
+            '/api/save-settings',
+            json={
+                'filename': test_filename,
+                'content': test_content
+            }
+        )
+        
+        assert response.status_code == 200
+        data = response.get_json()
+        assert data.get('success') is True
+        
+        # Verify file was created
+        settings_path = project_dir / test_filename
+        assert settings_path.exists()
+        
+        with open(settings_path, 'r', encoding='utf-8') as f:
+            saved_content = f.read()
+        assert saved_content == test_content
     
-    def test_save_all_settings_merges_configs(self):
+    def test_save_all_settings_merges_configs(self, client, project_dir):
         """Verify config merge preserves existing fields like plot_settings."""
-        client, app = get_test_client()
-        if client is None:
-            pytest.skip("Flask app not available")
-        
         # Get current analysis config
         response = client.get('/api/config/analysis')
         assert response.status_code == 200
-        original_config = json.loads(response.data)
+        original_config = response.get_json()
         
         # Note the plot_settings that should be preserved
         original_plot_settings = original_config.get('plot_settings', {})
         
         # Save with only partial update (no plot_settings)
-        test_filename = 'merge_test_DELETE_ME.txt'
+        test_filename = 'merge_test.txt'
         response = client.post(
             '/api/save-all',
-            data=json.dumps({
+            json={
                 'settings': {
                     'filename': test_filename,
                     'content': '# Test\n'
@@ -105,124 +171,98 @@ class TestSettingsSaveFlow:
                     'directories': original_config.get('directories', {}),
                     'report_types': ['TestReport']
                 }
-            }),
-            content_type='application/json'
+            }
         )
         
         assert response.status_code == 200
         
-        try:
-            # Verify plot_settings was preserved
-            response = client.get('/api/config/analysis')
-            updated_config = json.loads(response.data)
-            
-            assert updated_config.get('plot_settings') == original_plot_settings
-            assert updated_config.get('report_types') == ['TestReport']
-            
-        finally:
-            # Cleanup
-            test_file = BASE_DIR / test_filename
-            if test_file.exists():
-                test_file.unlink()
-            
-            # Restore original config
-            config_path = CONFIG_DIR / 'analysis_config.json'
-            with open(config_path, 'w', encoding='utf-8') as f:
-                json.dump(original_config, f, indent=2)
+        # Verify plot_settings was preserved
+        response = client.get('/api/config/analysis')
+        updated_config = response.get_json()
+        
+        assert updated_config.get('plot_settings') == original_plot_settings
+        assert updated_config.get('report_types') == ['TestReport']
     
-    def test_config_changes_persist(self):
+    def test_config_changes_persist(self, client, project_dir):
         """Verify modified configs are actually saved to disk."""
-        client, app = get_test_client()
-        if client is None:
-            pytest.skip("Flask app not available")
+        config_path = project_dir / 'config' / 'averager_config.json'
         
-        config_path = CONFIG_DIR / 'averager_config.json'
+        # Update config via API
+        new_folder = 'integration_test_folder'
+        response = client.post(
+            '/api/config/averager',
+            json={'folder': new_folder}
+        )
         
-        # Backup original
-        with open(config_path, 'r', encoding='utf-8') as f:
-            original_config = json.load(f)
+        assert response.status_code == 200
         
-        try:
-            # Update config via API
-            new_folder = 'integration_test_folder'
-            response = client.post(
-                '/api/config/averager',
-                data=json.dumps({'folder': new_folder}),
-                content_type='application/json'
-            )
-            
-            assert response.status_code == 200
-            
-            # Read file directly and verify change persisted
-            with open(config_path, 'r', encoding='utf-8') as f:
-                saved_config = json.load(f)
-            
-            assert saved_config.get('folder') == new_folder
-            
-        finally:
-            # Restore original
-            with open(config_path, 'w', encoding='utf-8') as f:
-                json.dump(original_config, f, indent=2)
+        # Read file directly and verify change persisted
+        saved_config = _read_json(config_path)
+        
+        assert saved_config.get('folder') == new_folder
 
 
 # ============================================================================
 # DEFAULT SETTINGS TESTS - Ensure new users can run without configuration
 # ============================================================================
 
+# Default values expected from HTML/JS (read-only, shared by tests)
+HTML_DEFAULTS = MappingProxyType({
+    'scenario_name': 'default_scenario',
+    'update_interval': 0.1,
+    'end_time': 43200,
+    'buffer_size': '5M',
+    'wait_time': '0, 120',
+    'speed': '0.5, 1.5',
+    'msg_ttl': 300,
+    'num_hosts': 40,
+    'router': 'EpidemicRouter',
+    'movement_model': 'ShortestPathMapBasedMovement',
+    'world_size': '4500, 3400',
+    'warmup': 1000,
+    'prophet_time_unit': 30,
+    'spray_copies': 6,
+    'cell_size_mult': 5,
+})
+
+# Default report filename: {scenarioName}_{router}_{seed}_{ttl}_{buffer}_{reportType}.txt
+_FILENAME_RE = re.compile(
+    r'^(?P<scenario>.+?)_(?P<router>[^_]+Router)_(?P<seed>\d+)_(?P<ttl>\d+)'
+    r'_(?P<buffer>[^_]+)_(?P<report>[^_]+Report)\.txt$'
+)
+
+
 class TestDefaultSettings:
     """Tests that verify defaults work for new users throughout the pipeline."""
     
-    # Default values expected from HTML/JS (for reference and testing)
-    HTML_DEFAULTS = {
-        'scenario_name': 'default_scenario',
-        'update_interval': 0.1,
-        'end_time': 43200,
-        'buffer_size': '5M',
-        'wait_time': '0, 120',
-        'speed': '0.5, 1.5',
-        'msg_ttl': 300,
-        'num_hosts': 40,
-        'router': 'EpidemicRouter',
-        'movement_model': 'ShortestPathMapBasedMovement',
-        'world_size': '4500, 3400',
-        'warmup': 1000,
-        'prophet_time_unit': 30,
-        'spray_copies': 6,
-        'cell_size_mult': 5,
+    # Top-level fields each post-processing script needs from its config
+    REQUIRED_KEYS = {
+        'analysis': {'directories', 'metrics', 'enabled_plots', 'plot_settings'},
+        'averager': {'folder', 'filename_pattern', 'data_separator'},
+        'regression': {'input', 'features', 'model_settings', 'output'},
     }
     
-    def test_analysis_config_has_sensible_defaults(self):
+    @pytest.mark.parametrize("config_name,required_keys", list(REQUIRED_KEYS.items()))
+    def test_config_has_required_keys(self, configs, config_name, required_keys):
+        """Verify each config file has the top-level fields its script needs."""
+        missing = required_keys - configs[config_name].keys()
+        assert not missing, f"{config_name}_config.json missing {sorted(missing)}"
+    
+    def test_analysis_config_has_sensible_defaults(self, configs):
         """Verify analysis_config.json has all required fields with defaults."""
-        config_path = CONFIG_DIR / 'analysis_config.json'
-        assert config_path.exists(), "analysis_config.json must exist"
-        
-        with open(config_path, 'r', encoding='utf-8') as f:
-            config = json.load(f)
+        config = configs['analysis']
         
         # Required structure for OppNDA to function
-        assert 'directories' in config
         assert 'report_dir' in config['directories']
         assert 'plots_dir' in config['directories']
-        assert 'metrics' in config
-        assert 'enabled_plots' in config
-        assert 'plot_settings' in config
         
         # Verify plot types are defined
         assert 'line_plots' in config['plot_settings']
         assert '3d_surface' in config['plot_settings']
     
-    def test_averager_config_has_sensible_defaults(self):
+    def test_averager_config_has_sensible_defaults(self, configs):
         """Verify averager_config.json has working default structure."""
-        config_path = CONFIG_DIR / 'averager_config.json'
-        assert config_path.exists(), "averager_config.json must exist"
-        
-        with open(config_path, 'r', encoding='utf-8') as f:
-            config = json.load(f)
-        
-        # Required for averager to parse files
-        assert 'folder' in config
-        assert 'filename_pattern' in config
-        assert 'data_separator' in config
+        config = configs['averager']
         
         # Filename pattern must have structure for parsing
         pattern = config['filename_pattern']
@@ -233,19 +273,9 @@ class TestDefaultSettings:
         components = pattern['components']
         assert 'router' in components or 'report_type' in components
     
-    def test_regression_config_has_sensible_defaults(self):
+    def test_regression_config_has_sensible_defaults(self, configs):
         """Verify regression_config.json has ML-ready defaults."""
-        config_path = CONFIG_DIR / 'regression_config.json'
-        assert config_path.exists(), "regression_config.json must exist"
-        
-        with open(config_path, 'r', encoding='utf-8') as f:
-            config = json.load(f)
-        
-        # Required structure
-        assert 'input' in config
-        assert 'features' in config
-        assert 'model_settings' in config
-        assert 'output' in config
+        config = configs['regression']
         
         # Must have some models enabled by default
         enabled_models = config['model_settings'].get('enabled_models', {})
@@ -254,7 +284,7 @@ class TestDefaultSettings:
     def test_default_one_settings_format(self):
         """Test that a settings file with defaults has valid ONE format."""
         # Simulate default GUI values generating settings content
-        defaults = self.HTML_DEFAULTS
+        defaults = HTML_DEFAULTS
         
         content = f"""## Scenario settings
 Scenario.name = {defaults['scenario_name']}_%%Group.router%%
@@ -299,16 +329,13 @@ Report.report2 = MessageStatsReport
         assert 'EpidemicRouter' in content
         assert '43200' in content  # 12 hours default
     
-    def test_default_filename_convention_matches_averager(self):
+    def test_default_filename_convention_matches_averager(self, configs):
         """Test that default report filenames can be parsed by averager."""
         # Default filename pattern from GUI
         # Format: {scenarioName}_{router}_{seed}_{ttl}_{buffer}_{reportType}.txt
         example_filename = "default_scenario_EpidemicRouter_1_300_5M_MessageStatsReport.txt"
         
-        # Load averager config
-        config_path = CONFIG_DIR / 'averager_config.json'
-        with open(config_path, 'r', encoding='utf-8') as f:
-            config = json.load(f)
+        config = configs['averager']
         
         # Parse filename according to config
         delimiter = config['filename_pattern']['delimiter']
@@ -319,30 +346,31 @@ Report.report2 = MessageStatsReport
         
         # Should be able to identify router and report type
         assert 'EpidemicRouter' in parts or 'Router' in ''.join(parts)
-    
-    def test_api_returns_configs_without_error(self):
-        """Test all config API endpoints return valid data with defaults."""
-        client, app = get_test_client()
-        if client is None:
-            pytest.skip("Flask app not available")
         
-        configs = ['analysis', 'averager', 'regression']
-        
-        for config_name in configs:
-            response = client.get(f'/api/config/{config_name}')
-            assert response.status_code == 200, f"Config {config_name} should load"
-            
-            data = json.loads(response.data)
-            assert 'error' not in data, f"Config {config_name} has error: {data}"
+        match = _FILENAME_RE.match(example_filename)
+        assert match, f"Filename should match the default convention: {example_filename}"
+        assert match.group('scenario') == 'default_scenario'
+        assert match.group('router') == 'EpidemicRouter'
+        assert match.group('report') == 'MessageStatsReport'
     
-    def test_save_default_settings_and_run_pipeline(self):
+    @pytest.mark.parametrize("config_name,expected_keys", [
+        ('analysis', {'directories', 'metrics'}),
+        ('averager', {'folder'}),
+        ('regression', {'features', 'input'}),
+    ])
+    def test_api_returns_configs_without_error(self, client, config_name, expected_keys):
+        """Test each config API endpoint returns valid data with defaults."""
+        response = client.get(f'/api/config/{config_name}')
+        assert response.status_code == 200, f"Config {config_name} should load"
+        
+        data = response.get_json()
+        assert 'error' not in data, f"Config {config_name} has error: {data}"
+        assert data.keys() & expected_keys, f"Config {config_name} missing {expected_keys}"
+    
+    def test_save_default_settings_and_run_pipeline(self, client, project_dir, script_recorder):
         """Full workflow test: save defaults, run mock simulation, verify post-processing."""
-        client, app = get_test_client()
-        if client is None:
-            pytest.skip("Flask app not available")
-        
-        defaults = self.HTML_DEFAULTS
-        test_filename = 'default_workflow_test_DELETE_ME.txt'
+        defaults = HTML_DEFAULTS
+        test_filename = 'default_workflow_test.txt'
         
         # Generate settings with defaults
         settings_content = f"""## Default Scenario
@@ -354,54 +382,33 @@ Report.nrofReports = 1
 Report.report1 = MessageStatsReport
 """
         
-        scripts_called = []
+        response = client.post(
+            '/api/save-all',
+            json={
+                'settings': {
+                    'filename': test_filename,
+                    'content': settings_content
+                }
+            }
+        )
         
-        def mock_subprocess_run(args, **kwargs):
-            if isinstance(args, list) and len(args) > 1:
-                script = str(args[1])
-                if 'averager.py' in script:
-                    scripts_called.append('averager')
-                elif 'analysis.py' in script:
-                    scripts_called.append('analysis')
-            return mock.Mock(returncode=0, stdout='OK', stderr='')
+        assert response.status_code == 200
+        data = response.get_json()
+        assert data.get('success') is True
         
-        try:
-            with mock.patch('subprocess.run', side_effect=mock_subprocess_run):
-                response = client.post(
-                    '/api/save-all',
-                    data=json.dumps({
-                        'settings': {
-                            'filename': test_filename,
-                            'content': settings_content
-                        }
-                    }),
-                    content_type='application/json'
-                )
-                
-                assert response.status_code == 200
-                data = json.loads(response.data)
-                assert data.get('success') is True
-                
-                # Verify settings file created
-                settings_file = BASE_DIR / test_filename
-                assert settings_file.exists()
-                
-                # Now run post-processing
-                response = client.post(
-                    '/api/process-data',
-                    data=json.dumps({'enable_ml': False}),
-                    content_type='application/json'
-                )
-                
-                assert response.status_code == 200
-                assert 'averager' in scripts_called
-                assert 'analysis' in scripts_called
-                
-        finally:
-            # Cleanup
-            test_file = BASE_DIR / test_filename
-            if test_file.exists():
-                test_file.unlink()
+        # Verify settings file created
+        settings_file = project_dir / test_filename
+        assert settings_file.exists()
+        
+        # Now run post-processing
+        response = client.post(
+            '/api/process-data',
+            json={'enable_ml': False}
+        )
+        
+        assert response.status_code == 200
+        assert 'averager' in script_recorder
+        assert 'analysis' in script_recorder
     
     def test_directories_exist_for_defaults(self):
         """Verify default directories referenced in configs exist or are created."""
@@ -410,22 +417,20 @@ Report.report1 = MessageStatsReport
         # Config dir must exist
         assert CONFIG_DIR.exists(), "config/ directory must exist"
         
-        # Core scripts must exist
+        # Core scripts must exist (one directory scan instead of a stat each)
         core_dir = BASE_DIR / 'core'
-        assert core_dir.exists(), "core/ directory must exist"
-        assert (core_dir / 'averager.py').exists(), "averager.py must exist"
-        assert (core_dir / 'analysis.py').exists(), "analysis.py must exist"
+        assert core_dir.is_dir(), "core/ directory must exist"
+        with os.scandir(core_dir) as entries:
+            core_files = {entry.name for entry in entries if entry.is_file()}
+        assert 'averager.py' in core_files, "averager.py must exist"
+        assert 'analysis.py' in core_files, "analysis.py must exist"
     
-    def test_api_default_settings_endpoint(self):
+    def test_api_default_settings_endpoint(self, client):
         """Test the /api/default-settings endpoint returns expected defaults."""
-        client, app = get_test_client()
-        if client is None:
-            pytest.skip("Flask app not available")
-        
         response = client.get('/api/default-settings')
         assert response.status_code == 200
         
-        data = json.loads(response.data)
+        data = response.get_json()
         assert 'defaults' in data
         
         defaults = data['defaults']
@@ -435,20 +440,15 @@ Report.report1 = MessageStatsReport
         assert defaults.get('buffer_size') == '5M'
         assert defaults.get('end_time') == 43200
     
-    def test_api_generate_default_settings(self):
+    def test_api_generate_default_settings(self, client):
         """Test the /api/default-settings/generate endpoint creates valid content."""
-        client, app = get_test_client()
-        if client is None:
-            pytest.skip("Flask app not available")
-        
         response = client.post(
             '/api/default-settings/generate',
-            data=json.dumps({'overrides': {'scenario_name': 'test_generated'}}),
-            content_type='application/json'
+            json={'overrides': {'scenario_name': 'test_generated'}}
         )
         
         assert response.status_code == 200
-        data = json.loads(response.data)
+        data = response.get_json()
         assert data.get('success') is True
         assert 'content' in data
         
@@ -465,32 +465,24 @@ Report.report1 = MessageStatsReport
 class TestSimulatorCommandBuilder:
     """Tests for cross-platform ONE simulator command building."""
     
-    def test_windows_command_format(self):
-        """Verify Windows ONE command uses one.bat."""
-        with mock.patch('platform.system', return_value='Windows'):
-            is_windows = platform.system() == 'Windows'
-            
-            if is_windows:
-                one_cmd = 'one.bat'
-                compile_cmd = 'compile.bat'
-            else:
-                one_cmd = './one.sh'
-                compile_cmd = './compile.sh'
-            
-            assert one_cmd == 'one.bat'
-            assert compile_cmd == 'compile.bat'
-    
-    def test_linux_command_format(self):
-        """Verify Linux ONE command uses ./one.sh."""
-        with mock.patch('platform.system', return_value='Linux'):
-            is_windows = platform.system() == 'Windows'
-            
-            if is_windows:
-                one_cmd = 'one.bat'
-            else:
-                one_cmd = './one.sh'
-            
-            assert one_cmd == './one.sh'
+    @pytest.mark.parametrize("system,expected_one,expected_compile", [
+        ('Windows', 'one.bat', 'compile.bat'),
+        ('Linux', './one.sh', './compile.sh'),
+    ])
+    def test_command_format(self, monkeypatch, system, expected_one, expected_compile):
+        """Verify the ONE command is one.bat on Windows and ./one.sh elsewhere."""
+        monkeypatch.setattr(platform, 'system', lambda: system)
+        is_windows = platform.system() == 'Windows'
+        
+        if is_windows:
+            one_cmd = 'one.bat'
+            compile_cmd = 'compile.bat'
+        else:
+            one_cmd = './one.sh'
+            compile_cmd = './compile.sh'
+        
+        assert one_cmd == expected_one
+        assert compile_cmd == expected_compile
     
     def test_batch_mode_flag(self):
         """Verify batch mode -b N flag is added correctly."""
@@ -505,10 +497,7 @@ class TestSimulatorCommandBuilder:
         
         command_parts.append(settings_file)
         
-        full_command = ' '.join(command_parts)
-        
-        assert '-b 5' in full_command
-        assert full_command == 'one.bat -b 5 test_settings.txt'
+        assert command_parts == ['one.bat', '-b', '5', 'test_settings.txt']
     
     def test_compile_flag_added(self):
         """Verify compile command is prepended when requested."""
@@ -526,11 +515,7 @@ class TestSimulatorCommandBuilder:
         command_parts.append(one_cmd)
         command_parts.append(settings_file)
         
-        full_command = ' '.join(command_parts)
-        
-        assert full_command.startswith('compile.bat &&')
-        assert 'one.bat' in full_command
-        assert full_command == 'compile.bat && one.bat my_settings.txt'
+        assert command_parts == ['compile.bat', '&&', 'one.bat', 'my_settings.txt']
 
 
 # ============================================================================
@@ -540,13 +525,9 @@ class TestSimulatorCommandBuilder:
 class TestFullPipeline:
     """End-to-end flow tests with mock simulator."""
     
-    def test_settings_save_then_run_mock_simulation(self, tmp_path):
+    def test_settings_save_then_run_mock_simulation(self, client, project_dir):
         """Test full flow: save settings, check command would be built correctly."""
-        client, app = get_test_client()
-        if client is None:
-            pytest.skip("Flask app not available")
-        
-        test_filename = 'pipeline_test_DELETE_ME.txt'
+        test_filename = 'pipeline_test.txt'
         test_content = "Scenario.name = pipeline_test\nScenario.endTime = 1000\n"
         
         # Mock subprocess.run to capture the command
@@ -556,94 +537,71 @@ class TestFullPipeline:
             
             response = client.post(
                 '/api/run-one',
-                data=json.dumps({
+                json={
                     'settings': {
                         'filename': test_filename,
                         'content': test_content
                     },
                     'batch_count': 3,
                     'compile': False
-                }),
-                content_type='application/json'
+                }
             )
             
             # Should return 404 because one.bat doesn't exist
             # But we can verify settings were saved
-            data = json.loads(response.data)
+            data = response.get_json()
             
             if response.status_code == 404:
                 # Expected - ONE simulator not found
                 assert data['results']['settings_saved'] is True
                 assert 'one.bat' in data.get('command', '') or 'one.sh' in data.get('command', '')
+    
+    @pytest.mark.parametrize("enable_ml,expected", [
+        (False, ['averager', 'analysis']),
+        (True, ['averager', 'analysis', 'regression']),
+    ])
+    def test_process_data_pipeline(self, client, script_recorder, enable_ml, expected):
+        """Verify post-processing runs averager -> analysis, then regression when ML is enabled."""
+        response = client.post(
+            '/api/process-data',
+            json={'enable_ml': enable_ml}
+        )
         
-        # Cleanup
-        test_file = BASE_DIR / test_filename
-        if test_file.exists():
-            test_file.unlink()
+        assert response.status_code == 200
+        data = response.get_json()
+        assert data.get('success') is True
+        
+        # Verify order
+        assert script_recorder == expected
+
+
+# ============================================================================
+# STATIC ASSET TESTS
+# ============================================================================
+
+class TestStaticAssets:
+    """Tests for GUI asset serving."""
     
-    def test_post_processing_pipeline_order(self):
-        """Verify post-processing scripts run in correct order: averager -> analysis."""
-        client, app = get_test_client()
-        if client is None:
-            pytest.skip("Flask app not available")
-        
-        call_order = []
-        
-        def mock_subprocess_run(args, **kwargs):
-            if isinstance(args, list) and len(args) > 1:
-                script = str(args[1]) if len(args) > 1 else str(args[0])
-                if 'averager.py' in script:
-                    call_order.append('averager')
-                elif 'analysis.py' in script:
-                    call_order.append('analysis')
-                elif 'regression.py' in script:
-                    call_order.append('regression')
-            
-            return mock.Mock(returncode=0, stdout='Success', stderr='')
+    def test_gui_assets_are_cacheable(self, client):
+        """Verify GUI files carry a max-age and revalidate with a 304."""
+        response = client.get('/GUI/config.js')
+        assert response.status_code == 200
+        assert 'max-age=3600' in response.headers.get('Cache-Control', '')
         
-        with mock.patch('subprocess.run', side_effect=mock_subprocess_run):
-            response = client.post(
-                '/api/process-data',
-                data=json.dumps({'enable_ml': False}),
-                content_type='application/json'
-            )
-            
-            assert response.status_code == 200
-            data = json.loads(response.data)
-            assert data.get('success') is True
-            
-            # Verify order
-            assert call_order == ['averager', 'analysis']
+        etag = response.headers.get('ETag')
+        assert etag
+        response = client.get('/GUI/config.js', headers={'If-None-Match': etag})
+        assert response.status_code == 304
     
-    def test_ml_regression_runs_when_enabled(self):
-        """Verify regression.py runs when enable_ml is True."""
-        client, app = get_test_client()
-        if client is None:
-            pytest.skip("Flask app not available")
-        
-        scripts_called = []
-        
-        def mock_subprocess_run(args, **kwargs):
-            if isinstance(args, list) and len(args) > 1:
-                script = str(args[1])
-                if 'averager.py' in script:
-                    scripts_called.append('averager')
-                elif 'analysis.py' in script:
-                    scripts_called.append('analysis')
-                elif 'regression.py' in script:
-                    scripts_called.append('regression')
-            
-            return mock.Mock(returncode=0, stdout='Success', stderr='')
+    def test_plots_are_not_long_cached(self, client, tmp_path, monkeypatch):
+        """Verify regenerated plots do not inherit the GUI max-age."""
+        _, app = get_test_client()
+        (tmp_path / 'plot.png').write_bytes(b'\x89PNG\r\n\x1a\n')
+        monkeypatch.setitem(app.config, 'PLOTS_DIR', tmp_path)
         
-        with mock.patch('subprocess.run', side_effect=mock_subprocess_run):
-            response = client.post(
-                '/api/process-data',
-                data=json.dumps({'enable_ml': True}),
-                content_type='application/json'
-            )
-            
-            assert response.status_code == 200
-            assert 'regression' in scripts_called
+        response = client.get('/plots/plot.png')
+        assert response.status_code == 200
+        assert 'max-age=3600' not in response.headers.get('Cache-Control', '')
 
 
 # ============================================================================
@@ -662,4 +620,4 @@ def run_integration_tests():
 
 
 if __name__ == "__main__":
-    run_integration_tests()
+    sys.exit(run_integration_tests())
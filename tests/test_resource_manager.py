@@ -6,7 +6,13 @@ Verifies memory estimation, dynamic worker calculation, and semaphore control.
 
 import os
 import sys
-import tempfile
+import math
+import threading
+import time
+from fractions import Fraction
+
+import numpy as np
+import pytest
 
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -17,28 +23,34 @@ from core.resource_manager import (
     MemoryEstimator,
     DynamicSemaphore,
     get_optimal_workers,
-    PSUTIL_AVAILABLE
+    PSUTIL_AVAILABLE,
+    _usable_cpu_count,
 )
 
 
 class TestResourceConfig:
     """Tests for ResourceConfig defaults"""
     
-    def test_default_eta(self):
-        """Verify default RAM threshold is 75%"""
-        assert ResourceConfig.ETA == 0.75
-    
-    def test_default_gamma(self):
-        """Verify default expansion factor is 3.0"""
-        assert ResourceConfig.GAMMA == 3.0
-    
-    def test_default_overhead(self):
-        """Verify default per-worker overhead is 50MB"""
-        assert ResourceConfig.M_OVERHEAD_MB == 50
-    
-    def test_safety_enabled_by_default(self):
-        """Verify safety is enabled by default"""
-        assert ResourceConfig.SAFETY_ENABLED is True
+    def test_defaults(self):
+        """Verify defaults: 75% RAM threshold (eta), 3.0 expansion factor
+        (gamma), 50MB per-worker overhead, and safety enabled"""
+        defaults = (ResourceConfig.ETA, ResourceConfig.GAMMA,
+                    ResourceConfig.M_OVERHEAD_MB, ResourceConfig.SAFETY_ENABLED)
+        assert defaults == (0.75, 3.0, 50, True)
+
+
+MB = 1024 * 1024
+
+# (gamma, overhead_mb, file_sizes, workers) for test_batch_memory_estimate
+BATCH_CASES = [
+    (2.0, 10, [5 * MB, 10 * MB, 3 * MB], 2),
+    (3.0, 50, [1 * MB, 7 * MB, 7 * MB, 2 * MB], 3),
+    (2.5, 30, [4 * MB, 1 * MB], 8),           # more workers than files
+    (1.7, 0.5, [123_457, 9_999_991, 42], 1),  # fractional per-file estimates
+    (3.0, 50, [], 4),                         # empty batch
+    (0.5, 0, [3, 5, 7], 3),                   # halves round down: 1 + 2 + 3
+    (3.0, 50, [2**53 + 1, 2**60], 2),         # beyond float precision
+]
 
 
 class TestMemoryEstimator:
@@ -55,27 +67,53 @@ class TestMemoryEstimator:
         expected = int(3.0 * file_size + 50 * 1024 * 1024)
         assert estimated == expected
     
-    def test_batch_memory_estimate(self):
-        """Test peak memory estimation for batch processing"""
+    @pytest.mark.parametrize("gamma,overhead_mb,file_sizes,workers", BATCH_CASES)
+    def test_batch_memory_estimate(self, gamma, overhead_mb, file_sizes, workers):
+        """Test peak memory uses the `workers` largest files (worst case)"""
+        estimator = MemoryEstimator(gamma=gamma, overhead_mb=overhead_mb)
+        
+        peak = estimator.estimate_batch_memory(file_sizes, workers)
+        
+        largest = sorted(file_sizes, reverse=True)[:workers]
+        expected = sum(math.floor(Fraction(gamma) * size) + int(overhead_mb * MB)
+                       for size in largest)
+        assert peak == expected
+    
+    def test_fractional_gamma_uses_integer_math(self):
+        """Test gamma=0.5 halves sizes exactly, rounding down"""
+        estimator = MemoryEstimator(gamma=0.5, overhead_mb=0)
+        assert estimator.estimate_file_memory(7) == 3
+        assert estimator.estimate_file_memory(2**53 + 2) == 2**52 + 1
+    
+    def test_batch_memory_estimate_properties(self):
+        """Property test (needs hypothesis): matches the sorted-slice formula and
+        never shrinks when a file is added"""
+        pytest.importorskip("hypothesis")
+        from hypothesis import given, strategies as st
+        
+        estimator = MemoryEstimator(gamma=3.0, overhead_mb=50)
+        
+        @given(st.lists(st.integers(0, 1 << 40), max_size=500), st.integers(1, 64))
+        def check(sizes, workers):
+            peak = estimator.estimate_batch_memory(sizes, workers)
+            largest = sorted(sizes, reverse=True)[:workers]
+            assert peak == sum(estimator.estimate_file_memory(size) for size in largest)
+            assert peak >= estimator.estimate_batch_memory(sizes[:-1], workers)
+        
+        check()
+    
+    def test_batch_memory_estimate_picks_largest(self):
+        """Test peak memory for 3 files and 2 workers uses the 10MB and 5MB files"""
         estimator = MemoryEstimator(gamma=2.0, overhead_mb=10)
         
-        # 3 files of different sizes, 2 workers
         file_sizes = [5 * 1024 * 1024, 10 * 1024 * 1024, 3 * 1024 * 1024]
-        workers = 2
+        peak = estimator.estimate_batch_memory(file_sizes, 2)
         
-        peak = estimator.estimate_batch_memory(file_sizes, workers)
-        
-        # Should use 2 largest files (10MB and 5MB)
         overhead_bytes = 10 * 1024 * 1024
         expected = (2.0 * 10 * 1024 * 1024 + overhead_bytes) + \
                    (2.0 * 5 * 1024 * 1024 + overhead_bytes)
         
         assert peak == int(expected)
-    
-    def test_empty_batch(self):
-        """Test empty file list returns 0"""
-        estimator = MemoryEstimator()
-        assert estimator.estimate_batch_memory([], 4) == 0
 
 
 class TestResourceManager:
@@ -114,6 +152,33 @@ class TestResourceManager:
         expected = min(ResourceConfig.FALLBACK_WORKERS, rm._cpu_count)
         assert workers == expected
     
+    def test_cpu_count_honours_affinity(self, monkeypatch):
+        """Test the usable CPU count follows the affinity mask, not os.cpu_count()"""
+        monkeypatch.setattr(os, 'sched_getaffinity', lambda pid: {0, 1}, raising=False)
+        monkeypatch.setattr(os, 'cpu_count', lambda: 64)
+        assert _usable_cpu_count() == 2
+        
+        monkeypatch.delattr(os, 'sched_getaffinity')
+        assert _usable_cpu_count() == 64
+    
+    @pytest.mark.skipif(not PSUTIL_AVAILABLE, reason="psutil not installed")
+    def test_memory_sampled_once_per_call(self, monkeypatch):
+        """Test each public call reads psutil.virtual_memory() exactly once"""
+        import psutil
+        rm = ResourceManager()
+        
+        calls = []
+        real_virtual_memory = psutil.virtual_memory
+        monkeypatch.setattr(psutil, 'virtual_memory',
+                            lambda: calls.append(1) or real_virtual_memory())
+        
+        rm.get_optimal_workers()
+        assert len(calls) == 1
+        
+        status = rm.get_memory_status()
+        assert len(calls) == 2
+        assert status['optimal_workers'] >= 1
+    
     def test_memory_status_returns_dict(self):
         """Test memory status returns a dictionary"""
         rm = ResourceManager()
@@ -153,6 +218,51 @@ class TestDynamicSemaphore:
         
         sem.release()
         assert sem.acquire(blocking=False) is True
+    
+    def test_rebalance_admits_more_workers(self):
+        """Test raising permits at runtime lets further acquires through"""
+        sem = DynamicSemaphore(initial_permits=1, safety_enabled=False)
+        
+        assert sem.acquire(blocking=False) is True
+        assert sem.acquire(blocking=False) is False
+        
+        sem.rebalance(4)
+        assert sem.current_permits == 4
+        assert [sem.acquire(blocking=False) for _ in range(4)] == [True, True, True, False]
+    
+    def test_release_wakes_blocked_acquire(self):
+        """Test each release admits exactly one blocked acquirer"""
+        sem = DynamicSemaphore(initial_permits=4, safety_enabled=False)
+        for _ in range(4):
+            sem.acquire()
+        
+        acquired = []
+        threads = [threading.Thread(target=lambda: acquired.append(sem.acquire()), daemon=True)
+                   for _ in range(8)]
+        for t in threads:
+            t.start()
+        
+        def wait_until(predicate, timeout=5.0):
+            deadline = time.monotonic() + timeout
+            while not predicate() and time.monotonic() < deadline:
+                time.sleep(0.001)
+            return predicate()
+        
+        # Release only once every thread is blocked, so no release is lost
+        assert wait_until(lambda: sem._waiting == 8)
+        for _ in range(4):
+            sem.release()
+        
+        assert wait_until(lambda: len(acquired) == 4 and sem._waiting == 4)
+        assert acquired == [True] * 4
+        assert sem._active_workers == 4
+        
+        # Let the remaining waiters through so no thread outlives the test
+        for _ in range(4):
+            sem.release()
+        for t in threads:
+            t.join(timeout=5)
+        assert acquired == [True] * 8
 
 
 class TestConvenienceFunction:
@@ -174,24 +284,78 @@ class TestConvenienceFunction:
         assert workers_unsafe >= 1
 
 
+def _make_sparse(directory, sizes):
+    """Create files of the given sizes without writing their contents"""
+    paths = []
+    for i, size in enumerate(sizes):
+        path = os.path.join(directory, f"test_{i}.txt")
+        with open(path, 'wb') as f:
+            f.truncate(size)
+        paths.append(path)
+    return paths
+
+
 class TestFileBasedEstimation:
     """Tests for file-based memory estimation"""
     
-    def test_with_temp_files(self):
+    def test_with_temp_files(self, tmp_path, monkeypatch):
         """Test estimation with actual temporary files"""
         rm = ResourceManager()
+        monkeypatch.setattr(rm, '_get_available_ram', lambda: 2 * 1024 ** 3)
         
         # Create temp files of known sizes
-        with tempfile.TemporaryDirectory() as tmpdir:
-            files = []
-            for i, size in enumerate([1024, 2048, 4096]):  # 1KB, 2KB, 4KB
-                path = os.path.join(tmpdir, f"test_{i}.txt")
-                with open(path, 'w') as f:
-                    f.write('x' * size)
-                files.append(path)
-            
-            workers = rm.get_optimal_workers(file_paths=files)
-            assert workers >= 1
+        files = _make_sparse(tmp_path, [1024, 2048, 4096])  # 1KB, 2KB, 4KB
+        
+        workers = rm.get_optimal_workers(file_paths=files)
+        assert workers >= 1
+        
+        # Known sizes skip the stat calls and give the same answer
+        def no_stat(paths):
+            raise AssertionError("get_file_sizes called despite file_sizes")
+        monkeypatch.setattr(rm._estimator, 'get_file_sizes', no_stat)
+        assert rm.get_optimal_workers(file_sizes=[1024, 2048, 4096]) == workers
+    
+    def test_module_wrapper_forwards_file_sizes(self, monkeypatch):
+        """Test the module-level wrapper passes file_paths/file_sizes by keyword"""
+        seen = {}
+        
+        def fake(self, file_paths=None, file_sizes=None):
+            seen.update(file_paths=file_paths, file_sizes=file_sizes)
+            return 3
+        monkeypatch.setattr(ResourceManager, 'get_optimal_workers', fake)
+        
+        assert get_optimal_workers(file_sizes=[1024]) == 3
+        assert seen == {'file_paths': None, 'file_sizes': [1024]}
+    
+    def test_large_batch_matches_unreduced_search(self, monkeypatch):
+        """Test 200k sizes give the same worker count as checking every P on all files"""
+        rng = np.random.default_rng(0)
+        sizes = rng.integers(0, 50 * 1024 * 1024, size=200_000).tolist()
+        
+        rm = ResourceManager()
+        monkeypatch.setattr(rm, '_get_available_ram', lambda: 2 * 1024 ** 3)
+        monkeypatch.setattr(rm, '_cpu_count', ResourceConfig.MAX_WORKERS)
+        
+        budget = int(rm.eta * 2 * 1024 ** 3)
+        expected = 1
+        for p in range(1, ResourceConfig.MAX_WORKERS + 1):
+            if rm._estimator.estimate_batch_memory(sizes, p) > budget:
+                break
+            expected = p
+        
+        assert rm.get_optimal_workers(file_sizes=sizes) == max(ResourceConfig.MIN_WORKERS, expected)
+    
+    def test_with_many_large_files(self, tmp_path):
+        """Test estimation over 100 sparse 10MB files (no data is written)"""
+        sizes = [10 * 1024 * 1024] * 100
+        files = _make_sparse(tmp_path, sizes)
+        
+        estimator = MemoryEstimator(gamma=3.0, overhead_mb=50)
+        assert estimator.get_file_sizes(files) == sizes
+        assert estimator.estimate_batch_memory(estimator.get_file_sizes(files), 4) == \
+            4 * estimator.estimate_file_memory(10 * 1024 * 1024)
+        
+        assert 1 <= ResourceManager().get_optimal_workers(file_paths=files) <= ResourceConfig.MAX_WORKERS
 
 
 # Pytest-compatible test runner
@@ -202,42 +366,4 @@ def test_psutil_availability():
 
 
 if __name__ == "__main__":
-    # Run tests standalone
-    print("="*60)
-    print("RESOURCE MANAGER TESTS")
-    print("="*60)
-    
-    test_classes = [
-        TestResourceConfig,
-        TestMemoryEstimator,
-        TestResourceManager,
-        TestDynamicSemaphore,
-        TestConvenienceFunction,
-        TestFileBasedEstimation,
-    ]
-    
-    passed = 0
-    failed = 0
-    
-    for test_class in test_classes:
-        instance = test_class()
-        for method_name in dir(instance):
-            if method_name.startswith('test_'):
-                try:
-                    getattr(instance, method_name)()
-                    print(f"[PASS] {test_class.__name__}.{method_name}")
-                    passed += 1
-                except Exception as e:
-                    print(f"[FAIL] {test_class.__name__}.{method_name}: {e}")
-                    failed += 1
-    
-    # Run standalone function tests
-    try:
-        test_psutil_availability()
-        print(f"[PASS] test_psutil_availability")
-        passed += 1
-    except Exception as e:
-        print(f"[FAIL] test_psutil_availability: {e}")
-        failed += 1
-    
-    print(f"\nResults: {passed} passed, {failed} failed")
+    sys.exit(pytest.main([__file__, "-x", "-q"]))